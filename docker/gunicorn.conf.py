@@ -6,15 +6,15 @@ import os
 # Bind to port from environment (Digital Ocean uses 8080)
 bind = f"0.0.0.0:{os.getenv('PORT', '8080')}"
 
-# Workers: (2 * CPU cores) + 1 is a good starting point
+# Workers: CPU cores + 1, concurrency comes from threads within each worker
 # For Digital Ocean Apps, use a fixed number based on dyno size
-workers = int(os.getenv("GUNICORN_WORKERS", multiprocessing.cpu_count() * 2 + 1))
+workers = int(os.getenv("GUNICORN_WORKERS", multiprocessing.cpu_count() + 1))
 
-# Worker class: sync is fine for most Django apps
-worker_class = "sync"
+# Worker class: gthread, so Strava API round-trips don't block a whole process
+worker_class = "gthread"
 
 # Threads per worker (for I/O bound workloads)
-threads = int(os.getenv("GUNICORN_THREADS", 2))
+threads = int(os.getenv("GUNICORN_THREADS", 8))
 
 # Timeout for worker processes (seconds)
 timeout = int(os.getenv("GUNICORN_TIMEOUT", 30))
@@ -23,8 +23,16 @@ timeout = int(os.getenv("GUNICORN_TIMEOUT", 30))
 keepalive = int(os.getenv("GUNICORN_KEEPALIVE", 5))
 
 # Maximum requests per worker before restart (prevents memory leaks)
-max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", 1000))
-max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", 100))
+# Jitter (~10%) staggers restarts so workers don't recycle at the same time
+max_requests = int(
+    os.getenv("GUNICORN_MAX_REQUESTS", os.getenv("MAX_REQUESTS", 2500))
+)
+max_requests_jitter = int(
+    os.getenv("GUNICORN_MAX_REQUESTS_JITTER", os.getenv("MAX_REQUESTS_JITTER", 250))
+)
+
+# Worker heartbeat files on tmpfs instead of the container filesystem
+worker_tmp_dir = "/dev/shm"
 
 # Graceful timeout for worker shutdown
 graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", 30))
@@ -48,3 +56,10 @@ umask = 0
 user = None
 group = None
 tmp_upload_dir = None
+
+
+def post_fork(server, worker):
+    """Give each worker its own Strava HTTP connection pool."""
+    from vught_pace_keeper.strava_integration.http import reset_session
+
+    reset_session()
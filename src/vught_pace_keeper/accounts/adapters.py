@@ -1,5 +1,11 @@
+from datetime import timedelta
+
 from allauth.account.adapter import DefaultAccountAdapter
 from allauth.socialaccount.adapter import DefaultSocialAccountAdapter
+from django.utils import timezone
+
+from vught_pace_keeper.accounts.models import StravaToken
+from vught_pace_keeper.accounts.strava_utils import invalidate_access_token
 
 
 class AccountAdapter(DefaultAccountAdapter):
@@ -38,39 +44,46 @@ class SocialAccountAdapter(DefaultSocialAccountAdapter):
             return
 
         extra_data = sociallogin.account.extra_data
-        user.strava_athlete_id = extra_data.get("id")
-        user.strava_profile_picture_url = extra_data.get("profile", "")
+        updates = {
+            "strava_athlete_id": extra_data.get("id"),
+            "strava_profile_picture_url": extra_data.get("profile", ""),
+        }
 
         # Use first/last name from Strava if not set
         if not user.first_name:
-            user.first_name = extra_data.get("firstname", "")
+            updates["first_name"] = extra_data.get("firstname", "")
         if not user.last_name:
-            user.last_name = extra_data.get("lastname", "")
-
-        user.save()
+            updates["last_name"] = extra_data.get("lastname", "")
+
+        # Only write the columns that actually changed (usually none on
+        # repeat logins), keeping the OAuth callback to a minimal UPDATE
+        changed = [
+            name for name, value in updates.items() if getattr(user, name) != value
+        ]
+        for name in changed:
+            setattr(user, name, updates[name])
+        if changed:
+            user.save(update_fields=changed)
 
         # Store tokens
         self._store_strava_tokens(user, sociallogin)
 
     def _store_strava_tokens(self, user, sociallogin):
         """Store Strava OAuth tokens for the user."""
-        from datetime import timedelta
-
-        from django.utils import timezone
-
-        from vught_pace_keeper.accounts.models import StravaToken
-
         token = sociallogin.token
 
         # Get expires_in from token or default to 6 hours
         expires_in = getattr(token, "expires_in", None) or 21600
 
-        StravaToken.objects.update_or_create(
-            user=user,
-            defaults={
-                "access_token": token.token,
-                "refresh_token": token.token_secret or "",
-                "expires_at": timezone.now() + timedelta(seconds=expires_in),
-                "scope": "read,read_all,activity:read_all",
-            },
+        StravaToken.objects.upsert(
+            [
+                StravaToken(
+                    user=user,
+                    access_token=token.token,
+                    refresh_token=token.token_secret or "",
+                    expires_at=timezone.now() + timedelta(seconds=expires_in),
+                    scope="read,read_all,activity:read_all",
+                )
+            ]
         )
+        invalidate_access_token(user.pk)
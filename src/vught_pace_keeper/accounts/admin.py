@@ -1,9 +1,18 @@
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 
 from .models import StravaToken, User
 
 
+class ColumnLimitedChangeList(ChangeList):
+    """Change list that lets the admin trim the columns loaded per row."""
+
+    def get_queryset(self, request, exclude_parameters=None):
+        queryset = super().get_queryset(request, exclude_parameters)
+        return self.model_admin.limit_changelist_columns(queryset)
+
+
 @admin.register(User)
 class UserAdmin(BaseUserAdmin):
     """Admin configuration for custom User model."""
@@ -30,6 +39,21 @@ class UserAdmin(BaseUserAdmin):
         ),
     )
 
+    def get_changelist(self, request, **kwargs):
+        return ColumnLimitedChangeList
+
+    def limit_changelist_columns(self, queryset):
+        """
+        Only load the listed columns on the change list.
+
+        Callables and other non-field list_display entries are skipped;
+        only() would reject them.
+        """
+        field_names = {field.name for field in self.model._meta.concrete_fields}
+        return queryset.only(
+            *[name for name in self.list_display if name in field_names]
+        )
+
 
 @admin.register(StravaToken)
 class StravaTokenAdmin(admin.ModelAdmin):
@@ -37,5 +61,13 @@ class StravaTokenAdmin(admin.ModelAdmin):
 
     list_display = ["user", "expires_at", "scope", "created_at"]
     list_filter = ["created_at"]
+    list_select_related = ["user"]
     search_fields = ["user__username", "user__email"]
     readonly_fields = ["created_at", "updated_at"]
+
+    def get_changelist(self, request, **kwargs):
+        return ColumnLimitedChangeList
+
+    def limit_changelist_columns(self, queryset):
+        """Skip loading (and Fernet-decrypting) the tokens on the change list."""
+        return queryset.defer("access_token", "refresh_token")
@@ -5,3 +5,7 @@ class AccountsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "vught_pace_keeper.accounts"
     verbose_name = "Accounts"
+
+    def ready(self):
+        # Import signals to register handlers
+        from vught_pace_keeper.accounts import signals  # noqa: F401
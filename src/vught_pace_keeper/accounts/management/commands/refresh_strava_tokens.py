@@ -0,0 +1,35 @@
+"""Refresh Strava access tokens that are expired or about to expire."""
+
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from vught_pace_keeper.accounts.models import StravaToken
+from vught_pace_keeper.accounts.strava_utils import refresh_strava_tokens_bulk
+
+
+class Command(BaseCommand):
+    help = "Refresh Strava tokens expiring within the given window in one batch."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--minutes",
+            type=int,
+            default=60,
+            help="Refresh tokens expiring within this many minutes (default: 60)",
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() + timedelta(minutes=options["minutes"])
+        tokens = list(
+            StravaToken.objects.filter(expires_at__lt=cutoff).only(
+                "id", "refresh_token"
+            )
+        )
+
+        refreshed = refresh_strava_tokens_bulk(tokens)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Refreshed {refreshed} of {len(tokens)} Strava tokens")
+        )
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.9 on 2026-10-15 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0004_add_last_strava_sync'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='stravatoken',
+            name='expires_at',
+            field=models.DateTimeField(db_index=True),
+        ),
+    ]
@@ -4,6 +4,10 @@ from django.utils import timezone
 
 from encrypted_fields.fields import EncryptedTextField
 
+from vught_pace_keeper.accounts.strava_utils import (
+    invalidate_has_strava,
+    refresh_strava_token,
+)
 from vught_pace_keeper.core.models import TimestampedModel
 
 
@@ -47,6 +51,40 @@ class User(AbstractUser):
         verbose_name_plural = "users"
 
 
+class StravaTokenQuerySet(models.QuerySet):
+    """QuerySet with a bulk upsert for Strava tokens."""
+
+    def upsert(self, tokens: list["StravaToken"]) -> list["StravaToken"]:
+        """
+        Insert or update tokens keyed by user in a single statement.
+
+        Uses INSERT ... ON CONFLICT (user_id) DO UPDATE, replacing a
+        SELECT + INSERT/UPDATE round-trip pair per user.
+
+        Args:
+            tokens: Unsaved StravaToken instances, at most one per user
+
+        Returns:
+            The given token instances
+        """
+        tokens = self.bulk_create(
+            tokens,
+            update_conflicts=True,
+            unique_fields=["user"],
+            update_fields=[
+                "access_token",
+                "refresh_token",
+                "expires_at",
+                "scope",
+                "updated_at",
+            ],
+        )
+        # bulk_create sends no post_save, so invalidate here
+        for token in tokens:
+            invalidate_has_strava(token.user_id)
+        return tokens
+
+
 class StravaToken(TimestampedModel):
     """
     Stores encrypted Strava OAuth tokens for a user.
@@ -61,12 +99,14 @@ class StravaToken(TimestampedModel):
     )
     access_token = EncryptedTextField()
     refresh_token = EncryptedTextField()
-    expires_at = models.DateTimeField()
+    expires_at = models.DateTimeField(db_index=True)
     scope = models.CharField(
         max_length=255,
         default="read,read_all,activity:read_all",
     )
 
+    objects = StravaTokenQuerySet.as_manager()
+
     class Meta:
         verbose_name = "Strava token"
         verbose_name_plural = "Strava tokens"
@@ -86,6 +126,4 @@ class StravaToken(TimestampedModel):
         if not self.is_expired():
             return False
 
-        from vught_pace_keeper.accounts.strava_utils import refresh_strava_token
-
         return refresh_strava_token(self)
@@ -0,0 +1,14 @@
+"""Signal handlers for accounts app."""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import StravaToken
+from .strava_utils import invalidate_has_strava
+
+
+@receiver(post_save, sender=StravaToken)
+@receiver(post_delete, sender=StravaToken)
+def invalidate_has_strava_on_token_change(sender, instance, **kwargs):
+    """Drop the cached Strava-connected flag when a token is added or removed."""
+    invalidate_has_strava(instance.user_id)
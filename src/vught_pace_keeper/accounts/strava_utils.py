@@ -1,11 +1,120 @@
 """Strava API utilities for token refresh and API calls."""
 
-from datetime import timedelta
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 
 import requests
 from django.conf import settings
+from django.core.cache import cache
 from django.utils import timezone
 
+from vught_pace_keeper.strava_integration.http import get_session
+
+STRAVA_TOKEN_URL = "https://www.strava.com/oauth/token"
+
+# Upper bound on concurrent token refresh requests in a bulk refresh
+BULK_REFRESH_WORKERS = 8
+
+# Cached access tokens are dropped this long before they actually expire
+TOKEN_CACHE_MARGIN = timedelta(seconds=60)
+
+# How long "does this user have a Strava token" answers stay in Django's cache
+HAS_STRAVA_CACHE_TTL = 300
+
+# In-process cache of decrypted access tokens: user_id -> (token, expires_at).
+# Deliberately not shared through Django's cache backend so plaintext tokens
+# never leave process memory.
+_token_cache: dict[int, tuple[str, datetime]] = {}
+_token_cache_lock = threading.Lock()
+
+
+def get_cached_access_token(user_id: int) -> str | None:
+    """
+    Return a cached, still-valid access token for a user.
+
+    Args:
+        user_id: Primary key of the token owner
+
+    Returns:
+        Access token, or None if not cached or about to expire
+    """
+    with _token_cache_lock:
+        entry = _token_cache.get(user_id)
+        if entry is None:
+            return None
+
+        access_token, expires_at = entry
+        if expires_at - timezone.now() < TOKEN_CACHE_MARGIN:
+            del _token_cache[user_id]
+            return None
+
+        return access_token
+
+
+def cache_access_token(user_id: int, access_token: str, expires_at: datetime) -> None:
+    """Cache an access token for a user unless it is about to expire."""
+    with _token_cache_lock:
+        if expires_at - timezone.now() < TOKEN_CACHE_MARGIN:
+            _token_cache.pop(user_id, None)
+        else:
+            _token_cache[user_id] = (access_token, expires_at)
+
+
+def invalidate_access_token(user_id: int) -> None:
+    """Drop a user's cached access token (e.g. after a 401 or reconnect)."""
+    with _token_cache_lock:
+        _token_cache.pop(user_id, None)
+
+
+def has_strava_cache_key(user_id: int) -> str:
+    """Cache key for whether a user has a connected Strava account."""
+    return f"user:{user_id}:has_strava"
+
+
+def invalidate_has_strava(user_id: int) -> None:
+    """Drop a user's cached Strava-connected flag (on connect/disconnect)."""
+    cache.delete(has_strava_cache_key(user_id))
+
+
+def _post_refresh(session, strava_token) -> dict | None:
+    """
+    POST a refresh_token grant for a single token.
+
+    Args:
+        session: requests.Session used for the call
+        strava_token: StravaToken model instance
+
+    Returns:
+        Token response payload, or None if the refresh failed
+    """
+    try:
+        response = session.post(
+            STRAVA_TOKEN_URL,
+            data={
+                "client_id": settings.STRAVA_CLIENT_ID,
+                "client_secret": settings.STRAVA_CLIENT_SECRET,
+                "grant_type": "refresh_token",
+                "refresh_token": strava_token.refresh_token,
+            },
+            timeout=30,
+        )
+    except requests.RequestException:
+        return None
+
+    if response.status_code != 200:
+        return None
+
+    return json.loads(response.content)
+
+
+def _apply_refresh(strava_token, data: dict) -> None:
+    """Copy a token response payload onto a StravaToken instance."""
+    strava_token.access_token = data["access_token"]
+    strava_token.refresh_token = data["refresh_token"]
+    strava_token.expires_at = timezone.now() + timedelta(seconds=data["expires_in"])
+
 
 def refresh_strava_token(strava_token) -> bool:
     """
@@ -19,28 +128,62 @@ def refresh_strava_token(strava_token) -> bool:
     Returns:
         True if token was successfully refreshed, False otherwise
     """
-    response = requests.post(
-        "https://www.strava.com/oauth/token",
-        data={
-            "client_id": settings.STRAVA_CLIENT_ID,
-            "client_secret": settings.STRAVA_CLIENT_SECRET,
-            "grant_type": "refresh_token",
-            "refresh_token": strava_token.refresh_token,
-        },
-        timeout=30,
-    )
-
-    if response.status_code != 200:
+    data = _post_refresh(get_session(), strava_token)
+    if data is None:
         return False
 
-    data = response.json()
-    strava_token.access_token = data["access_token"]
-    strava_token.refresh_token = data["refresh_token"]
-    strava_token.expires_at = timezone.now() + timedelta(seconds=data["expires_in"])
+    _apply_refresh(strava_token, data)
     strava_token.save()
+    cache_access_token(
+        strava_token.user_id, strava_token.access_token, strava_token.expires_at
+    )
     return True
 
 
+def refresh_strava_tokens_bulk(tokens) -> int:
+    """
+    Refresh many Strava tokens concurrently.
+
+    Token requests are issued in parallel over the shared pooled session,
+    so N refreshes take roughly one round-trip instead of N. All
+    successfully refreshed tokens are written back with one bulk_update.
+
+    Args:
+        tokens: Iterable of StravaToken instances to refresh
+
+    Returns:
+        Number of tokens that were refreshed
+    """
+    # Local import: accounts.models imports this module
+    from vught_pace_keeper.accounts.models import StravaToken
+
+    tokens = list(tokens)
+    if not tokens:
+        return 0
+
+    workers = min(BULK_REFRESH_WORKERS, len(tokens))
+    session = get_session()
+    with ThreadPoolExecutor(workers) as executor:
+        results = list(
+            executor.map(lambda token: _post_refresh(session, token), tokens)
+        )
+
+    updated = []
+    for strava_token, data in zip(tokens, results):
+        if data is None:
+            continue
+        _apply_refresh(strava_token, data)
+        strava_token.updated_at = timezone.now()
+        updated.append(strava_token)
+
+    if updated:
+        StravaToken.objects.bulk_update(
+            updated, ["access_token", "refresh_token", "expires_at", "updated_at"]
+        )
+
+    return len(updated)
+
+
 def get_strava_athlete(access_token: str) -> dict | None:
     """
     Fetch the authenticated athlete's profile from Strava.
@@ -51,7 +194,7 @@ def get_strava_athlete(access_token: str) -> dict | None:
     Returns:
         Dict with athlete data or None if request failed
     """
-    response = requests.get(
+    response = get_session().get(
         "https://www.strava.com/api/v3/athlete",
         headers={"Authorization": f"Bearer {access_token}"},
         timeout=30,
@@ -60,4 +203,4 @@ def get_strava_athlete(access_token: str) -> dict | None:
     if response.status_code != 200:
         return None
 
-    return response.json()
+    return json.loads(response.content)
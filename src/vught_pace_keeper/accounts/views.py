@@ -18,10 +18,18 @@ def landing_page(request):
 @login_required
 def dashboard(request):
     """User dashboard showing training plans and Strava connection status."""
-    training_plans = TrainingPlan.objects.filter(user=request.user).order_by(
-        "-created_at"
+    # Only load the columns (and rows) the dashboard cards render
+    plan_fields = ("id", "name", "plan_type", "duration_weeks", "target_race_date")
+    training_plans = (
+        TrainingPlan.objects.filter(user=request.user)
+        .only(*plan_fields)
+        .order_by("-created_at")[:3]
+    )
+    template_plans = (
+        TrainingPlan.objects.filter(is_template=True)
+        .only(*plan_fields, "goal_time")
+        .order_by("name")[:2]
     )
-    template_plans = TrainingPlan.objects.filter(is_template=True).order_by("name")
 
     # Get weekly summary for quick stats
     analytics = TrainingAnalyticsService(request.user)
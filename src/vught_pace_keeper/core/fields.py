@@ -0,0 +1,93 @@
+import math
+import sys
+import zlib
+from array import array
+from base64 import b64encode
+
+from django.db import models
+
+
+class CompressedArrayField(models.BinaryField):
+    """
+    A list of numbers stored as a zlib-compressed little-endian array.
+
+    Reads back as a plain list, so it can replace a JSONField holding a
+    numeric list while storing a fraction of the bytes and skipping JSON
+    encoding/decoding. None items are stored as NaN in float arrays
+    ("f"/"d") and as the type's minimum value in integer arrays. Integer
+    arrays round float samples to the nearest int.
+    """
+
+    description = "Compressed numeric array"
+
+    FLOAT_TYPECODES = ("f", "d")
+
+    def __init__(self, *args, typecode="d", **kwargs):
+        self.typecode = typecode
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        kwargs["typecode"] = self.typecode
+        return name, path, args, kwargs
+
+    @property
+    def _is_float(self) -> bool:
+        return self.typecode in self.FLOAT_TYPECODES
+
+    @property
+    def _null_int(self) -> int:
+        """Sentinel stored for None in integer arrays."""
+        bits = array(self.typecode).itemsize * 8
+        if self.typecode.isupper():  # Unsigned
+            return (1 << bits) - 1
+        return -(1 << (bits - 1))
+
+    def _encode(self, values) -> bytes:
+        if self._is_float:
+            null, coerce = math.nan, float
+        else:
+            null, coerce = self._null_int, round
+        try:
+            data = array(
+                self.typecode,
+                [null if value is None else coerce(value) for value in values],
+            )
+        except (TypeError, ValueError, OverflowError) as e:
+            raise ValueError(
+                f"{self.name}: can't store values in a {self.typecode!r} array: {e}"
+            ) from e
+        if sys.byteorder != "little":
+            data.byteswap()
+        return zlib.compress(data.tobytes())
+
+    def _decode(self, blob) -> list:
+        data = array(self.typecode)
+        data.frombytes(zlib.decompress(blob))
+        if sys.byteorder != "little":
+            data.byteswap()
+        values = data.tolist()
+        if self._is_float:
+            return [None if math.isnan(value) else value for value in values]
+        null = self._null_int
+        return [None if value == null else value for value in values]
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return value
+        return self._decode(value)
+
+    def to_python(self, value):
+        if value is None or isinstance(value, list):
+            return value
+        # Serialized (base64) or raw bytes
+        return self._decode(super().to_python(value))
+
+    def get_prep_value(self, value):
+        value = super().get_prep_value(value)
+        if isinstance(value, (list, tuple)):
+            return self._encode(value)
+        return value
+
+    def value_to_string(self, obj):
+        return b64encode(self._encode(self.value_from_object(obj))).decode("ascii")
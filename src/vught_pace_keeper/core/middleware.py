@@ -0,0 +1,40 @@
+"""Core middleware."""
+
+from django.conf import settings
+from django.http import HttpResponse
+
+
+class MaxUploadSizeMiddleware:
+    """
+    Reject oversized multipart uploads to the views in MAX_UPLOAD_SIZE_VIEWS.
+
+    Checks the declared Content-Length in process_view, which runs before
+    CsrfViewMiddleware's (the first thing to touch request.POST/FILES), so
+    an upload above MAX_UPLOAD_SIZE is answered with 413 without being
+    streamed to a temporary file first. Other views, admin included, keep
+    Django's default handling; form-level size checks still apply below
+    the cap.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.max_size = settings.MAX_UPLOAD_SIZE
+        self.view_names = frozenset(settings.MAX_UPLOAD_SIZE_VIEWS)
+
+    def __call__(self, request):
+        return self.get_response(request)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if (
+            request.method != "POST"
+            or request.content_type != "multipart/form-data"
+            or request.resolver_match.view_name not in self.view_names
+        ):
+            return None
+        try:
+            content_length = int(request.META.get("CONTENT_LENGTH") or 0)
+        except ValueError:
+            content_length = 0
+        if content_length > self.max_size:
+            return HttpResponse("Upload too large.", status=413)
+        return None
@@ -0,0 +1,61 @@
+"""Tests for custom model fields."""
+
+import math
+from types import SimpleNamespace
+
+import pytest
+
+from vught_pace_keeper.core.fields import CompressedArrayField
+
+
+def round_trip(field: CompressedArrayField, values: list) -> list:
+    """Encode values the way they're saved and decode them as they're read."""
+    return field.from_db_value(field.get_prep_value(values), None, None)
+
+
+class TestCompressedArrayField:
+    def test_float_round_trip(self):
+        field = CompressedArrayField()
+        assert round_trip(field, [0.0, 1.5, -2.25]) == [0.0, 1.5, -2.25]
+
+    def test_float_none_is_kept(self):
+        field = CompressedArrayField()
+        assert round_trip(field, [1.0, None, 3.0]) == [1.0, None, 3.0]
+
+    def test_float_nan_reads_back_as_none(self):
+        field = CompressedArrayField()
+        assert round_trip(field, [math.nan, 2.0]) == [None, 2.0]
+
+    def test_int_round_trip(self):
+        field = CompressedArrayField(typecode="i")
+        assert round_trip(field, [0, 1, 3600, -5]) == [0, 1, 3600, -5]
+
+    def test_int_none_is_kept(self):
+        field = CompressedArrayField(typecode="i")
+        assert round_trip(field, [150, None, 152]) == [150, None, 152]
+
+    def test_int_rounds_float_samples(self):
+        field = CompressedArrayField(typecode="i")
+        assert round_trip(field, [1.4, 1.6, 2.0]) == [1, 2, 2]
+
+    @pytest.mark.parametrize("typecode", ["d", "i"])
+    def test_empty_list(self, typecode):
+        field = CompressedArrayField(typecode=typecode)
+        assert round_trip(field, []) == []
+
+    def test_null_column_stays_none(self):
+        field = CompressedArrayField()
+        assert field.from_db_value(None, None, None) is None
+
+    def test_to_python_accepts_serialized_value(self):
+        field = CompressedArrayField(typecode="i")
+        field.attname = "data"
+
+        obj = SimpleNamespace(data=[1, None, 3])
+        assert field.to_python(field.value_to_string(obj)) == [1, None, 3]
+
+    @pytest.mark.parametrize("value", ["abc", 2**40])
+    def test_int_rejects_unstorable_values(self, value):
+        field = CompressedArrayField(typecode="i")
+        with pytest.raises(ValueError):
+            field.get_prep_value([value])
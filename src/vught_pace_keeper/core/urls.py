@@ -8,4 +8,5 @@ app_name = "core"
 
 urlpatterns = [
     path("health/", views.health_check, name="health"),
+    path("ready/", views.readiness_check, name="ready"),
 ]
@@ -1,21 +1,21 @@
 """Core views including health checks."""
 
 import logging
+import time
 
 from django.db import connection
 from django.http import JsonResponse
 
 logger = logging.getLogger(__name__)
 
+# A successful database probe is trusted for this many seconds
+HEALTH_CHECK_CACHE_SECONDS = 5.0
 
-def health_check(request):
-    """
-    Health check endpoint for container orchestration.
+_last_ok_at: float = 0.0
 
-    Returns:
-        - 200 OK: Application is healthy
-        - 503 Service Unavailable: Database connection failed
-    """
+
+def _database_response() -> JsonResponse:
+    """Probe the database and build the health check response."""
     health_status = {
         "status": "healthy",
         "checks": {
@@ -35,3 +35,38 @@ def health_check(request):
         return JsonResponse(health_status, status=503)
 
     return JsonResponse(health_status, status=200)
+
+
+def health_check(request):
+    """
+    Health check endpoint for container orchestration.
+
+    A healthy database probe is reused for HEALTH_CHECK_CACHE_SECONDS, so
+    frequent liveness polling doesn't add a query per hit.
+
+    Returns:
+        - 200 OK: Application is healthy
+        - 503 Service Unavailable: Database connection failed
+    """
+    global _last_ok_at
+
+    if time.monotonic() - _last_ok_at < HEALTH_CHECK_CACHE_SECONDS:
+        return JsonResponse(
+            {"status": "healthy", "checks": {"database": "ok"}}, status=200
+        )
+
+    response = _database_response()
+    if response.status_code == 200:
+        _last_ok_at = time.monotonic()
+    return response
+
+
+def readiness_check(request):
+    """
+    Readiness endpoint that always probes the database.
+
+    Returns:
+        - 200 OK: Application is ready to serve traffic
+        - 503 Service Unavailable: Database connection failed
+    """
+    return _database_response()
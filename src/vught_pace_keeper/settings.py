@@ -58,6 +58,7 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",  # Serve static files in production
+    "vught_pace_keeper.core.middleware.MaxUploadSizeMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -103,6 +104,11 @@ DATABASES = {
 # Force PostGIS backend (in case DATABASE_URL uses postgres:// instead of postgis://)
 DATABASES["default"]["ENGINE"] = "django.contrib.gis.db.backends.postgis"
 
+# Keep connections open between requests instead of reconnecting every time;
+# health checks discard connections the server has closed in the meantime
+DATABASES["default"]["CONN_MAX_AGE"] = env.int("CONN_MAX_AGE", default=60)
+DATABASES["default"]["CONN_HEALTH_CHECKS"] = True
+
 # Require SSL for production database connections
 if not DEBUG:
     DATABASES["default"].setdefault("OPTIONS", {})
@@ -153,6 +159,20 @@ STATIC_ROOT = env("STATIC_ROOT", default=BASE_DIR / "staticfiles")
 MEDIA_URL = "media/"
 MEDIA_ROOT = env("MEDIA_ROOT", default=BASE_DIR / "media")
 
+# Keep uploads up to the GPX limit (10MB) in memory instead of spooling them
+# to a temporary file that the parser then reads back from disk
+FILE_UPLOAD_MAX_MEMORY_SIZE = 10 * 1024 * 1024
+
+# Multipart POSTs to the GPX upload views declaring a larger body are refused
+# with 413 before they are read (MaxUploadSizeMiddleware); the GPX limit plus
+# room for the other form fields. Other views are not capped.
+MAX_UPLOAD_SIZE = 11 * 1024 * 1024
+MAX_UPLOAD_SIZE_VIEWS = [
+    "training:workout_log_gpx",
+    "training:workout_log_gpx_for_scheduled",
+    "training:gpx_preview",
+]
+
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.1/ref/settings/#default-auto-field
@@ -201,6 +221,10 @@ SALT_KEY = env("SALT_KEY", default=SECRET_KEY[:16])
 STRAVA_CLIENT_ID = env("STRAVA_CLIENT_ID", default="")
 STRAVA_CLIENT_SECRET = env("STRAVA_CLIENT_SECRET", default="")
 
+# Re-fetch the latest synced day on each sync to pick up activities that were
+# uploaded to Strava late (costs extra API calls on every sync)
+STRAVA_CATCHUP_ENABLED = env.bool("STRAVA_CATCHUP_ENABLED", default=False)
+
 SOCIALACCOUNT_PROVIDERS = {
     "strava": {
         "SCOPE": ["read,activity:read_all"],
@@ -218,6 +242,32 @@ if STRAVA_CLIENT_ID and STRAVA_CLIENT_SECRET:
     ]
 
 
+# =============================================================================
+# Cache and Sessions
+# =============================================================================
+
+# With REDIS_URL set (requires the redis package), the cache is shared by all
+# workers and sessions are stored there instead of in the database.
+# Without it, each process keeps its own in-memory cache.
+REDIS_URL = env("REDIS_URL", default="")
+
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+    SESSION_ENGINE = "django.contrib.sessions.backends.cache"
+    SESSION_CACHE_ALIAS = "default"
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
+
 # =============================================================================
 # WhiteNoise Configuration (Static Files)
 # =============================================================================
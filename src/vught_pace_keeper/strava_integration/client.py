@@ -1,25 +1,38 @@
 """Low-level Strava API client."""
 
+import json
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-import requests
+from django.core.cache import cache
+
+from vught_pace_keeper.accounts.models import StravaToken
+from vught_pace_keeper.accounts.strava_utils import (
+    cache_access_token,
+    get_cached_access_token,
+    invalidate_access_token,
+)
 
 from .exceptions import StravaAPIError, StravaAuthError, StravaRateLimitError
+from .http import get_session
 
 if TYPE_CHECKING:
     from vught_pace_keeper.accounts.models import User
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StravaActivity:
     """Represents a Strava activity."""
 
     id: int
     name: str
     type: str
-    start_date: datetime
+    start_date: datetime  # local time of the activity
+    start_date_utc: datetime
     distance: float  # meters
     moving_time: int  # seconds
     elapsed_time: int  # seconds
@@ -35,7 +48,9 @@ class StravaActivity:
             id=data["id"],
             name=data.get("name", ""),
             type=data.get("type", ""),
-            start_date=datetime.fromisoformat(data["start_date_local"].replace("Z", "+00:00")),
+            # fromisoformat (C-implemented) accepts the trailing "Z" since 3.11
+            start_date=datetime.fromisoformat(data["start_date_local"]),
+            start_date_utc=datetime.fromisoformat(data["start_date"]),
             distance=data.get("distance", 0),
             moving_time=data.get("moving_time", 0),
             elapsed_time=data.get("elapsed_time", 0),
@@ -46,11 +61,69 @@ class StravaActivity:
         )
 
 
+def _error_body(response) -> dict | list | None:
+    """Decode an error response body, tolerating empty or non-JSON bodies."""
+    if not response.content:
+        return None
+    try:
+        return json.loads(response.content)
+    except ValueError:
+        return None
+
+
+def _rate_limit_reset_in(response) -> int | None:
+    """
+    Work out how long Strava will keep rejecting requests.
+
+    Strava reports app-wide limits and usage as "15min,daily" pairs in the
+    X-RateLimit-Limit / X-RateLimit-Usage headers. The 15-minute window
+    resets on the quarter hour and the daily window at midnight UTC.
+
+    Args:
+        response: Strava API response
+
+    Returns:
+        Seconds until requests will be accepted again, or None if the
+        quota is not exhausted
+    """
+    retry_after = response.headers.get("Retry-After")
+    if retry_after and retry_after.isdigit():
+        return max(int(retry_after), 1)
+
+    try:
+        limit_15min, limit_daily = map(
+            int, response.headers["X-RateLimit-Limit"].split(",")[:2]
+        )
+        usage_15min, usage_daily = map(
+            int, response.headers["X-RateLimit-Usage"].split(",")[:2]
+        )
+    except (KeyError, ValueError):
+        limit_15min = limit_daily = usage_15min = usage_daily = None
+
+    now = int(time.time())
+    if usage_daily is not None and usage_daily >= limit_daily:
+        return 86400 - now % 86400
+    if (usage_15min is not None and usage_15min >= limit_15min) or (
+        response.status_code == 429
+    ):
+        return 900 - now % 900
+    return None
+
+
 class StravaClient:
     """Low-level Strava API client with error handling."""
 
     BASE_URL = "https://www.strava.com/api/v3"
     TIMEOUT = 30
+    PAGE_FETCH_WORKERS = 4  # Concurrent page requests in get_all_activities
+
+    # Circuit breaker: cache key holding the epoch time the quota resets
+    RATE_LIMIT_CACHE_KEY = "strava:rate_limited_until"
+
+    # Transient server errors are retried with exponential backoff + jitter
+    RETRY_STATUS_CODES = frozenset({500, 502, 503, 504})
+    MAX_ATTEMPTS = 3
+    RETRY_BACKOFF = 0.5  # seconds
 
     def __init__(self, user: "User"):
         """
@@ -64,12 +137,29 @@ class StravaClient:
         self._ensure_valid_token()
 
     def _ensure_valid_token(self) -> None:
-        """Refresh token if expired and cache access token."""
-        if not hasattr(self.user, "strava_token"):
+        """
+        Refresh token if expired and cache access token.
+
+        A still-valid token cached for this user is used as-is, skipping the
+        StravaToken query and Fernet decryption entirely.
+        """
+        self._access_token = get_cached_access_token(self.user.pk)
+        if self._access_token:
+            return
+
+        # Token fields are decrypted when the row is loaded; defer the refresh
+        # token so it is only fetched and decrypted if a refresh is needed
+        strava_token = (
+            StravaToken.objects.defer("refresh_token").filter(user=self.user).first()
+        )
+        if strava_token is None:
             raise StravaAuthError("No Strava account connected")
 
-        self.user.strava_token.refresh_if_needed()
-        self._access_token = self.user.strava_token.access_token
+        strava_token.refresh_if_needed()
+        self._access_token = strava_token.access_token
+        cache_access_token(
+            self.user.pk, strava_token.access_token, strava_token.expires_at
+        )
 
     def _get_headers(self) -> dict:
         """Get authorization headers."""
@@ -89,37 +179,61 @@ class StravaClient:
 
         Raises:
             StravaAuthError: On 401 response
-            StravaRateLimitError: On 429 response
+            StravaRateLimitError: On 429 response, or while the quota is
+                known to be exhausted (without calling Strava)
             StravaAPIError: On other errors
         """
+        rate_limited_until = cache.get(self.RATE_LIMIT_CACHE_KEY)
+        if rate_limited_until and time.time() < rate_limited_until:
+            raise StravaRateLimitError(
+                "Strava rate limit exceeded. Please try again in 15 minutes.",
+                status_code=429,
+            )
+
         url = f"{self.BASE_URL}{endpoint}"
         kwargs.setdefault("timeout", self.TIMEOUT)
         kwargs.setdefault("headers", {}).update(self._get_headers())
 
-        response = requests.request(method, url, **kwargs)
+        for attempt in range(1, self.MAX_ATTEMPTS + 1):
+            response = get_session().request(method, url, **kwargs)
+            if (
+                response.status_code not in self.RETRY_STATUS_CODES
+                or attempt == self.MAX_ATTEMPTS
+            ):
+                break
+            time.sleep(
+                self.RETRY_BACKOFF * 2 ** (attempt - 1)
+                + random.uniform(0, self.RETRY_BACKOFF)
+            )
+
+        reset_in = _rate_limit_reset_in(response)
+        if reset_in is not None:
+            cache.set(self.RATE_LIMIT_CACHE_KEY, time.time() + reset_in, reset_in)
 
         if response.status_code == 401:
+            invalidate_access_token(self.user.pk)
             raise StravaAuthError(
                 "Strava authentication failed. Please reconnect your account.",
                 status_code=401,
-                response=response.json() if response.text else None,
+                response=_error_body(response),
             )
 
         if response.status_code == 429:
             raise StravaRateLimitError(
                 "Strava rate limit exceeded. Please try again in 15 minutes.",
                 status_code=429,
-                response=response.json() if response.text else None,
+                response=_error_body(response),
             )
 
         if response.status_code >= 400:
             raise StravaAPIError(
                 f"Strava API error: {response.status_code}",
                 status_code=response.status_code,
-                response=response.json() if response.text else None,
+                response=_error_body(response),
             )
 
-        return response.json()
+        # Decode straight from bytes, skipping requests' str decoding pass
+        return json.loads(response.content)
 
     def get_athlete(self) -> dict:
         """
@@ -168,6 +282,9 @@ class StravaClient:
         """
         Fetch all activities with pagination.
 
+        After the first page, further pages are requested concurrently in
+        batches of PAGE_FETCH_WORKERS over the shared connection pool.
+
         Args:
             after: Only return activities after this time
             before: Only return activities before this time
@@ -176,24 +293,29 @@ class StravaClient:
         Returns:
             List of all StravaActivity objects
         """
-        all_activities = []
-        page = 1
         per_page = 100  # Use larger page size for efficiency
 
-        while page <= max_pages:
-            activities = self.get_activities(
+        def fetch_page(page: int) -> list[StravaActivity]:
+            return self.get_activities(
                 after=after, before=before, page=page, per_page=per_page
             )
 
-            if not activities:
-                break
-
-            all_activities.extend(activities)
-
-            if len(activities) < per_page:
-                break
-
-            page += 1
+        # The first page tells us whether there is anything more to fetch
+        all_activities = fetch_page(1)
+        if len(all_activities) < per_page:
+            return all_activities
+
+        # Fetch the remaining pages in small concurrent batches, stopping at
+        # the first short page (at most PAGE_FETCH_WORKERS - 1 wasted calls)
+        page = 2
+        with ThreadPoolExecutor(max_workers=self.PAGE_FETCH_WORKERS) as executor:
+            while page <= max_pages:
+                pages = range(page, min(page + self.PAGE_FETCH_WORKERS, max_pages + 1))
+                for activities in executor.map(fetch_page, pages):
+                    all_activities.extend(activities)
+                    if len(activities) < per_page:
+                        return all_activities
+                page = pages.stop
 
         return all_activities
 
@@ -0,0 +1,53 @@
+"""Shared, pooled HTTP session for Strava API calls."""
+
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+USER_AGENT = "vught-pace-keeper/1.0"
+
+# Keep-alive connections per host, sized for gthread workers
+POOL_MAXSIZE = 32
+
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+
+
+def _build_session() -> requests.Session:
+    """Create a session with a keep-alive connection pool."""
+    session = requests.Session()
+    session.headers["User-Agent"] = USER_AGENT
+    session.mount("https://", HTTPAdapter(pool_maxsize=POOL_MAXSIZE))
+    return session
+
+
+def get_session() -> requests.Session:
+    """
+    Get the process-wide Strava HTTP session.
+
+    Reusing one session keeps TLS connections to strava.com alive between
+    calls instead of paying a new handshake per request.
+
+    Returns:
+        Shared requests.Session
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _build_session()
+    return _session
+
+
+def reset_session() -> None:
+    """
+    Discard the shared session so the next call builds a fresh one.
+
+    Called from the gunicorn post_fork hook: with preload_app the session
+    may already exist in the master, and pooled sockets must not be
+    shared between worker processes.
+    """
+    global _session
+    with _session_lock:
+        _session = None
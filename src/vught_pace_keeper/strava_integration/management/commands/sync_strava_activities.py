@@ -0,0 +1,40 @@
+"""Sync Strava activities for connected users outside the request cycle."""
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+
+from vught_pace_keeper.strava_integration.exceptions import StravaError
+from vught_pace_keeper.strava_integration.services import ActivitySyncService
+
+
+class Command(BaseCommand):
+    help = "Import new Strava activities for all (or selected) connected users."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--user",
+            action="append",
+            dest="usernames",
+            default=[],
+            help="Only sync this username (may be repeated)",
+        )
+
+    def handle(self, *args, **options):
+        users = get_user_model().objects.filter(strava_token__isnull=False)
+        if options["usernames"]:
+            users = users.filter(username__in=options["usernames"])
+
+        for user in users.iterator():
+            try:
+                result = ActivitySyncService(user).sync_activities()
+            except StravaError as e:
+                self.stderr.write(f"{user.username}: sync failed: {e}")
+                continue
+
+            self.stdout.write(
+                f"{user.username}: imported {result.imported}, "
+                f"skipped {result.skipped}, matched {result.matched}, "
+                f"errors {result.error_count}"
+            )
+
+        self.stdout.write(self.style.SUCCESS("Strava sync finished"))
@@ -1,15 +1,27 @@
 """High-level services for Strava activity synchronization."""
 
+import struct
+import sys
+from array import array
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from decimal import Decimal
+from itertools import chain
 from typing import TYPE_CHECKING
 
 import polyline
-from django.contrib.gis.geos import LineString
+from django.conf import settings
+from django.contrib.gis.geos import GEOSGeometry, LineString
+from django.db import transaction
+from django.db.models import DateField, ExpressionWrapper, F, IntegerField, Max
 from django.utils import timezone
 
 from vught_pace_keeper.training.models import ActivityStream, CompletedWorkout, ScheduledWorkout
+from vught_pace_keeper.training.services.goals import GoalTrackingService
+from vught_pace_keeper.training.services.records import PersonalRecordService
+from vught_pace_keeper.training.services.training_load import TrainingLoadService
 
 from .client import StravaActivity, StravaClient
 
@@ -17,6 +29,52 @@ if TYPE_CHECKING:
     from vught_pace_keeper.accounts.models import User
 
 
+# WKB geometry type code for a 2D LineString
+WKB_LINESTRING = 2
+
+
+def _from_hundredths(hundredths: int) -> Decimal:
+    """Convert an integer count of hundredths to a 2-decimal-place Decimal."""
+    return Decimal(hundredths).scaleb(-2)
+
+
+# Calendar date of a scheduled workout, computed in SQL as
+#   plan start (race date - duration weeks) + (week_number - 1) weeks
+#   + (day_of_week - 1) days
+# PostgreSQL's date + integer arithmetic adds whole days.
+SCHEDULED_WORKOUT_DATE = ExpressionWrapper(
+    F("week__plan__target_race_date")
+    + ExpressionWrapper(
+        7 * (F("week__week_number") - 1 - F("week__plan__duration_weeks"))
+        + F("day_of_week")
+        - 1,
+        output_field=IntegerField(),
+    ),
+    output_field=DateField(),
+)
+
+
+@dataclass(slots=True)
+class SyncError:
+    """
+    Failures of one kind during a sync, grouped by stage and exception type.
+
+    The message is only formatted when displayed.
+    """
+
+    stage: str  # "import", "match" or "store streams for"
+    exception: Exception
+    activity_ids: list[int] = field(default_factory=list)
+
+    def __str__(self) -> str:
+        if not self.activity_ids:
+            return f"Failed to {self.stage} activities: {self.exception}"
+        subject = f"activity {self.activity_ids[0]}"
+        if len(self.activity_ids) > 1:
+            subject += f" and {len(self.activity_ids) - 1} more"
+        return f"Failed to {self.stage} {subject}: {self.exception}"
+
+
 @dataclass
 class SyncResult:
     """Result of a sync operation."""
@@ -24,12 +82,31 @@ class SyncResult:
     imported: int = 0
     skipped: int = 0
     matched: int = 0
-    errors: list[str] = field(default_factory=list)
+    errors: list[SyncError] = field(default_factory=list)
 
     @property
     def total_processed(self) -> int:
         return self.imported + self.skipped
 
+    @property
+    def error_count(self) -> int:
+        """Number of failures, counting each activity in a group."""
+        return sum(max(len(error.activity_ids), 1) for error in self.errors)
+
+    def add_error(
+        self, stage: str, exception: Exception, activity_id: int | None = None
+    ) -> None:
+        """Record a failure, folding it into an existing group of the same kind."""
+        for error in self.errors:
+            if error.stage == stage and type(error.exception) is type(exception):
+                break
+        else:
+            # Drop the traceback so failed frames aren't kept alive
+            error = SyncError(stage, exception.with_traceback(None))
+            self.errors.append(error)
+        if activity_id is not None:
+            error.activity_ids.append(activity_id)
+
 
 class ActivitySyncService:
     """Service for syncing Strava activities to CompletedWorkout records."""
@@ -37,6 +114,20 @@ class ActivitySyncService:
     # Default lookback period for first sync
     DEFAULT_LOOKBACK_DAYS = 365
 
+    # Rows per INSERT statement when bulk-creating workouts
+    BULK_BATCH_SIZE = 200
+
+    # Activity streams fetched and inserted per batch (each may be MBs)
+    STREAM_BATCH_SIZE = 25
+
+    # Concurrent stream requests; the client's rate-limit breaker stops
+    # all of them once Strava's quota is used up
+    STREAM_FETCH_WORKERS = 4
+
+    # Douglas-Peucker tolerance for stored routes, in degrees (~5 m at
+    # mid-latitudes); sub-meter detail isn't needed for a training log
+    ROUTE_SIMPLIFY_TOLERANCE = 0.00005
+
     def __init__(self, user: "User"):
         """
         Initialize sync service for a user.
@@ -63,27 +154,73 @@ class ActivitySyncService:
         activities = self.client.get_all_activities(after=since)
         result = SyncResult()
 
-        for activity in activities:
-            # Only sync running activities
-            if activity.type != "Run":
-                continue
-
-            # Skip if already imported
-            if self._already_imported(activity.id):
-                result.skipped += 1
-                continue
+        # Only sync running activities
+        runs = [activity for activity in activities if activity.type == "Run"]
 
+        built_workouts = []
+        for activity in runs:
             try:
-                workout = self._create_completed_workout(activity)
-                result.imported += 1
+                built_workouts.append(self._build_completed_workout(activity))
+            except Exception as e:
+                result.add_error("import", e, activity.id)
+
+        # Already-imported activities are skipped by the database itself
+        new_workouts = self._insert_new_workouts(built_workouts)
+        result.imported = len(new_workouts)
+        result.skipped = len(built_workouts) - len(new_workouts)
+
+        # Fetch activity streams (pace, HR, etc.) concurrently and insert them
+        # per batch; streams can be large, so only one batch is held at a time
+        with ThreadPoolExecutor(max_workers=self.STREAM_FETCH_WORKERS) as executor:
+            for start in range(0, len(new_workouts), self.STREAM_BATCH_SIZE):
+                batch = new_workouts[start : start + self.STREAM_BATCH_SIZE]
+                streams = executor.map(self._build_activity_stream, batch)
+                try:
+                    # Savepoint, so a failed batch can't break an outer transaction
+                    with transaction.atomic():
+                        ActivityStream.objects.bulk_create(
+                            [stream for stream in streams if stream is not None]
+                        )
+                except Exception as e:
+                    # Don't fail workout import if streams can't be stored;
+                    # the workouts are saved and still need matching below
+                    for workout in batch:
+                        result.add_error(
+                            "store streams for", e, workout.strava_activity_id
+                        )
+
+        # Look up candidate scheduled workouts for all dates at once, match
+        # in memory, then write all matches with a single UPDATE
+        matched_workouts = []
+        try:
+            candidates = self._unmatched_scheduled_by_date(
+                {workout.date for workout in new_workouts}
+            )
+        except Exception as e:
+            result.add_error("match", e)
+            candidates = {}
+        for workout in new_workouts:
+            scheduled_ids = candidates.get(workout.date)
+            if scheduled_ids:
+                # Each scheduled workout can be claimed by one activity only
+                workout.scheduled_workout_id = scheduled_ids.pop(0)
+                matched_workouts.append(workout)
 
-                # Fetch and store activity streams (pace, HR, etc.)
-                self._fetch_and_store_streams(activity.id, workout)
+        try:
+            with transaction.atomic():
+                CompletedWorkout.objects.bulk_update(
+                    matched_workouts,
+                    ["scheduled_workout"],
+                    batch_size=self.BULK_BATCH_SIZE,
+                )
+        except Exception as e:
+            result.add_error("match", e)
+            for workout in matched_workouts:
+                workout.scheduled_workout_id = None
+        else:
+            result.matched = len(matched_workouts)
 
-                if self._try_match_scheduled(workout):
-                    result.matched += 1
-            except Exception as e:
-                result.errors.append(f"Failed to import activity {activity.id}: {e}")
+        self._update_derived_data(new_workouts)
 
         # Update last sync timestamp
         self.user.last_strava_sync = timezone.now()
@@ -94,19 +231,26 @@ class ActivitySyncService:
     def _get_sync_start_time(self) -> datetime:
         """Get the start time for syncing activities.
 
-        Uses the date of the latest Strava-synced workout rather than
-        the sync timestamp, to catch late-uploaded activities.
+        Resumes from the start time of the latest Strava-synced activity,
+        so Strava only returns newer activities. With
+        STRAVA_CATCHUP_ENABLED, re-fetches from midnight of the latest
+        workout's date instead, to catch late-uploaded activities.
         """
-        # Find the most recent Strava-synced workout
-        latest_workout = (
-            CompletedWorkout.objects.filter(
-                user=self.user,
-                source=CompletedWorkout.Source.STRAVA,
-            )
-            .order_by("-date")
-            .first()
+        strava_workouts = CompletedWorkout.objects.filter(
+            user=self.user,
+            source=CompletedWorkout.Source.STRAVA,
         )
 
+        if not settings.STRAVA_CATCHUP_ENABLED:
+            latest_start = strava_workouts.aggregate(
+                latest=Max("strava_start_date")
+            )["latest"]
+            if latest_start:
+                return latest_start
+
+        # Find the most recent Strava-synced workout
+        latest_workout = strava_workouts.order_by("-date").first()
+
         if latest_workout:
             # Start from the beginning of that workout's date (midnight)
             # to ensure we don't miss same-day activities
@@ -117,34 +261,83 @@ class ActivitySyncService:
         # First sync: look back DEFAULT_LOOKBACK_DAYS
         return timezone.now() - timedelta(days=self.DEFAULT_LOOKBACK_DAYS)
 
-    def _already_imported(self, strava_id: int) -> bool:
-        """Check if activity has already been imported."""
-        return CompletedWorkout.objects.filter(strava_activity_id=strava_id).exists()
+    def _insert_new_workouts(
+        self, workouts: list[CompletedWorkout]
+    ) -> list[CompletedWorkout]:
+        """
+        Insert workouts, skipping Strava activities that are already imported.
+
+        Activities already in the database are filtered out with one query,
+        the rest are bulk-inserted with ON CONFLICT DO NOTHING on the unique
+        strava_activity_id, so overlapping syncs can't import an activity
+        twice. If two syncs do overlap, both may count it as imported.
 
-    def _create_completed_workout(self, activity: StravaActivity) -> CompletedWorkout:
+        Unlike saving workouts one at a time, a database error in this bulk
+        insert aborts the whole sync rather than failing a single activity.
+
+        Args:
+            workouts: Unsaved CompletedWorkout instances from Strava
+
+        Returns:
+            The workouts that were inserted, with PKs set
         """
-        Create a CompletedWorkout from a Strava activity.
+        if not workouts:
+            return []
+
+        already_imported = set(
+            CompletedWorkout.objects.filter(
+                strava_activity_id__in=[w.strava_activity_id for w in workouts]
+            ).values_list("strava_activity_id", flat=True)
+        )
+        new_workouts = [
+            w for w in workouts if w.strava_activity_id not in already_imported
+        ]
+        if not new_workouts:
+            return []
+
+        CompletedWorkout.objects.bulk_create(
+            new_workouts, batch_size=self.BULK_BATCH_SIZE, ignore_conflicts=True
+        )
+
+        # bulk_create() doesn't set PKs with ignore_conflicts; read them back
+        pks = dict(
+            CompletedWorkout.objects.filter(
+                strava_activity_id__in=[w.strava_activity_id for w in new_workouts]
+            ).values_list("strava_activity_id", "pk")
+        )
+        for workout in new_workouts:
+            workout.pk = pks.get(workout.strava_activity_id)
+        return [workout for workout in new_workouts if workout.pk is not None]
+
+    def _build_completed_workout(self, activity: StravaActivity) -> CompletedWorkout:
+        """
+        Build an unsaved CompletedWorkout from a Strava activity.
 
         Args:
             activity: StravaActivity instance
 
         Returns:
-            Created CompletedWorkout instance
+            Unsaved CompletedWorkout instance
         """
-        distance_km = Decimal(str(activity.distance / 1000)).quantize(Decimal("0.01"))
+        # Meters / 10 = hundredths of a km
+        distance_km = _from_hundredths(round(activity.distance / 10))
         duration = timedelta(seconds=activity.moving_time)
         pace = self._calculate_pace(activity.distance, activity.moving_time)
+        elevation_gain_m = (
+            _from_hundredths(round(activity.total_elevation_gain * 100))
+            if activity.total_elevation_gain
+            else None
+        )
 
-        return CompletedWorkout.objects.create(
+        return CompletedWorkout(
             user=self.user,
             date=activity.start_date.date(),
+            strava_start_date=activity.start_date_utc,
             actual_distance_km=distance_km,
             actual_duration=duration,
             average_pace_min_per_km=pace,
             average_heart_rate=int(activity.average_heartrate) if activity.average_heartrate else None,
-            elevation_gain_m=Decimal(str(activity.total_elevation_gain)).quantize(Decimal("0.01"))
-            if activity.total_elevation_gain
-            else None,
+            elevation_gain_m=elevation_gain_m,
             route=self._decode_polyline(activity.map_polyline),
             source=CompletedWorkout.Source.STRAVA,
             strava_activity_id=activity.id,
@@ -165,11 +358,8 @@ class ActivitySyncService:
         if distance_meters <= 0 or time_seconds <= 0:
             return Decimal("0.00")
 
-        distance_km = distance_meters / 1000
-        time_minutes = time_seconds / 60
-        pace = time_minutes / distance_km
-
-        return Decimal(str(pace)).quantize(Decimal("0.01"))
+        # (seconds / 60) / (meters / 1000) min/km, in hundredths
+        return _from_hundredths(round(time_seconds * 5000 / (3 * distance_meters)))
 
     def _decode_polyline(self, encoded: str | None) -> LineString | None:
         """
@@ -185,77 +375,82 @@ class ActivitySyncService:
             return None
 
         try:
-            coords = polyline.decode(encoded)
-            # Polyline returns (lat, lng), but PostGIS expects (lng, lat)
-            points = [(lng, lat) for lat, lng in coords]
+            # geojson=True returns (lng, lat), the axis order PostGIS expects
+            coords = polyline.decode(encoded, geojson=True)
 
-            if len(points) < 2:
+            if len(coords) < 2:
                 return None
 
-            return LineString(points, srid=4326)
+            # Hand GEOS the whole route as little-endian WKB in one call,
+            # instead of setting every point on a coordinate sequence
+            flat = array("d", chain.from_iterable(coords))
+            if sys.byteorder != "little":
+                flat.byteswap()
+            wkb = struct.pack("<BII", 1, WKB_LINESTRING, len(coords)) + flat.tobytes()
+
+            route = GEOSGeometry(memoryview(wkb), srid=4326)
+            simplified = route.simplify(
+                self.ROUTE_SIMPLIFY_TOLERANCE, preserve_topology=False
+            )
+            if isinstance(simplified, LineString) and simplified.num_points >= 2:
+                return simplified
+            return route
         except Exception:
             return None
 
-    def _try_match_scheduled(self, workout: CompletedWorkout) -> bool:
+    def _unmatched_scheduled_by_date(self, dates: set[date]) -> dict[date, list[int]]:
         """
-        Try to auto-match a workout to a scheduled workout.
+        Map dates to the user's unmatched scheduled workouts on them.
 
-        Matches by date for the user's active training plans.
+        One query for the whole sync instead of one per activity.
 
         Args:
-            workout: CompletedWorkout to match
+            dates: Dates of the workouts to match
 
         Returns:
-            True if matched, False otherwise
+            Dict of date -> ScheduledWorkout IDs, most recent plan first
         """
-        # Find scheduled workouts for this date
-        # We need to calculate which scheduled workouts fall on this date
-        # by looking at the plan start date + week number + day of week
-
-        from django.db.models import F
-
-        # Get all active plans for this user
-        scheduled = (
-            ScheduledWorkout.objects.filter(week__plan__user=self.user)
-            .select_related("week__plan")
+        if not dates:
+            return {}
+
+        # Compute each scheduled workout's date in SQL; plans without a race
+        # date yield NULL and so never match
+        rows = (
+            ScheduledWorkout.objects.filter(
+                week__plan__user=self.user,
+                completions__isnull=True,
+            )
+            .annotate(workout_date=SCHEDULED_WORKOUT_DATE)
+            .filter(workout_date__in=dates)
             .order_by("-week__plan__created_at")  # Most recent plan first
+            .values_list("pk", "workout_date")
         )
 
-        for sw in scheduled:
-            plan = sw.week.plan
-            # Calculate plan start date from target_race_date and duration
-            if not plan.target_race_date or not plan.duration_weeks:
-                continue
-
-            plan_start = plan.target_race_date - timedelta(weeks=plan.duration_weeks)
+        by_date = defaultdict(list)
+        for pk, workout_date in rows:
+            by_date[workout_date].append(pk)
+        return by_date
 
-            # Calculate the date of this scheduled workout
-            week_start = plan_start + timedelta(weeks=sw.week.week_number - 1)
-            workout_date = week_start + timedelta(days=sw.day_of_week - 1)
-
-            if workout_date == workout.date:
-                # Check if already matched to another completion
-                if not sw.completions.exists():
-                    workout.scheduled_workout = sw
-                    workout.save(update_fields=["scheduled_workout"])
-                    return True
-
-        return False
-
-    def _fetch_and_store_streams(self, activity_id: int, workout: CompletedWorkout) -> None:
+    def _build_activity_stream(
+        self, workout: CompletedWorkout
+    ) -> ActivityStream | None:
         """
-        Fetch activity streams from Strava and store in ActivityStream.
+        Fetch activity streams from Strava and build an unsaved ActivityStream.
 
         Args:
-            activity_id: Strava activity ID
-            workout: CompletedWorkout to associate streams with
+            workout: Saved CompletedWorkout imported from Strava
+
+        Returns:
+            Unsaved ActivityStream, or None if no stream data is available
         """
         try:
             stream_types = ["time", "distance", "heartrate", "velocity_smooth", "altitude"]
-            streams = self.client.get_activity_streams(activity_id, stream_types)
+            streams = self.client.get_activity_streams(
+                workout.strava_activity_id, stream_types
+            )
 
             if not streams:
-                return
+                return None
 
             # Extract data arrays from stream response
             # Strava returns {type: {data: [...], ...}, ...}
@@ -267,7 +462,7 @@ class ActivitySyncService:
 
             # Only create stream if we have some data
             if time_data or distance_data:
-                ActivityStream.objects.create(
+                return ActivityStream(
                     workout=workout,
                     time_data=time_data,
                     distance_data=distance_data,
@@ -278,3 +473,31 @@ class ActivitySyncService:
         except Exception:
             # Don't fail workout import if stream fetch fails
             pass
+
+        return None
+
+    def _update_derived_data(self, workouts: list[CompletedWorkout]) -> None:
+        """
+        Update training load, personal records and goals for new workouts.
+
+        bulk_create() doesn't send post_save, so this does once per sync
+        what the CompletedWorkout signal handlers do per saved workout.
+
+        Args:
+            workouts: Newly imported workouts
+        """
+        if not workouts:
+            return
+
+        TrainingLoadService(self.user).recalculate_from_date(
+            min(workout.date for workout in workouts)
+        )
+
+        # Check in chronological order so each PR is compared to earlier ones
+        record_service = PersonalRecordService(self.user)
+        for workout in sorted(workouts, key=lambda w: w.date):
+            for pr in record_service.check_for_pr(workout):
+                if pr.is_new_pr:
+                    record_service.create_record(workout, pr.distance, pr.time)
+
+        GoalTrackingService(self.user).check_all_goals()
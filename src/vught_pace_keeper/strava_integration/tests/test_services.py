@@ -0,0 +1,119 @@
+"""Tests for the Strava sync service."""
+
+from datetime import date, datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+
+from vught_pace_keeper.strava_integration.client import StravaActivity
+from vught_pace_keeper.strava_integration.services import ActivitySyncService
+from vught_pace_keeper.training.models import (
+    CompletedWorkout,
+    ScheduledWorkout,
+    TrainingPlan,
+    TrainingWeek,
+)
+
+RACE_DATE = date(2026, 10, 4)
+
+
+def make_activity(activity_id: int, day: date) -> StravaActivity:
+    start = timezone.make_aware(datetime.combine(day, datetime.min.time()))
+    return StravaActivity(
+        id=activity_id,
+        name=f"Run {activity_id}",
+        type="Run",
+        start_date=start,
+        start_date_utc=start,
+        distance=10000.0,
+        moving_time=3000,
+        elapsed_time=3100,
+        total_elevation_gain=0.0,
+        average_heartrate=None,
+        max_heartrate=None,
+        map_polyline=None,
+    )
+
+
+@pytest.fixture
+def user():
+    return get_user_model().objects.create_user(username="runner", password="x")
+
+
+@pytest.fixture
+def service(user):
+    # StravaClient refreshes tokens on init; no Strava calls in these tests
+    with patch("vught_pace_keeper.strava_integration.services.StravaClient"):
+        service = ActivitySyncService(user)
+    service.client.get_activity_streams.return_value = {}
+    return service
+
+
+@pytest.mark.django_db
+def test_insert_new_workouts_skips_imported_activities(service, user):
+    day = date(2026, 9, 1)
+    existing = service._build_completed_workout(make_activity(1, day))
+    existing.save()
+
+    workouts = [
+        service._build_completed_workout(make_activity(activity_id, day))
+        for activity_id in (1, 2)
+    ]
+    inserted = service._insert_new_workouts(workouts)
+
+    assert inserted == [workouts[1]]
+    assert workouts[1].pk is not None
+    assert workouts[0].pk is None
+    assert CompletedWorkout.objects.filter(user=user).count() == 2
+    assert CompletedWorkout.objects.get(strava_activity_id=1).pk == existing.pk
+
+
+@pytest.mark.django_db
+def test_insert_new_workouts_with_only_imported_activities(service, user):
+    day = date(2026, 9, 1)
+    service._build_completed_workout(make_activity(1, day)).save()
+
+    workout = service._build_completed_workout(make_activity(1, day))
+
+    assert service._insert_new_workouts([workout]) == []
+    assert workout.pk is None
+    assert CompletedWorkout.objects.filter(user=user).count() == 1
+
+
+@pytest.mark.django_db
+def test_sync_claims_each_scheduled_workout_once(service, user):
+    plan = TrainingPlan.objects.create(
+        user=user,
+        name="Half",
+        plan_type=TrainingPlan.PlanType.HALF_MARATHON,
+        duration_weeks=1,
+        target_race_date=RACE_DATE,
+    )
+    week = TrainingWeek.objects.create(
+        plan=plan, week_number=1, focus=TrainingWeek.WeekFocus.BASE
+    )
+    scheduled = [
+        ScheduledWorkout.objects.create(
+            week=week,
+            day_of_week=1,
+            workout_type=ScheduledWorkout.WorkoutType.EASY,
+            order_in_day=order,
+        )
+        for order in (1, 2)
+    ]
+    # Week 1 of a one-week plan starts a week before race day
+    day = RACE_DATE - timedelta(days=7)
+    service.client.get_all_activities.return_value = [
+        make_activity(activity_id, day) for activity_id in (1, 2, 3)
+    ]
+
+    result = service.sync_activities(since=timezone.now() - timedelta(days=60))
+
+    assert result.imported == 3
+    assert result.matched == 2
+    claimed = CompletedWorkout.objects.filter(
+        user=user, scheduled_workout__isnull=False
+    ).values_list("scheduled_workout_id", flat=True)
+    assert sorted(claimed) == sorted(workout.pk for workout in scheduled)
@@ -1,18 +1,37 @@
 """Views for Strava activity synchronization."""
 
+from django.conf import settings
 from django.contrib.auth.decorators import login_required
+from django.core.cache import cache
 from django.http import HttpResponseNotAllowed
 from django.shortcuts import render
 
 from vught_pace_keeper.accounts.models import StravaToken
+from vught_pace_keeper.accounts.strava_utils import (
+    HAS_STRAVA_CACHE_TTL,
+    has_strava_cache_key,
+)
 
 from .exceptions import StravaAuthError, StravaRateLimitError
 from .services import ActivitySyncService
 
 
 def _user_has_strava(user) -> bool:
-    """Check if user has a connected Strava account."""
-    return StravaToken.objects.filter(user=user).exists()
+    """
+    Check if user has a connected Strava account.
+
+    Cached because the sync status widget polls this; StravaToken signals
+    invalidate the cached value on connect/disconnect. Only cached with a
+    shared (Redis) cache: the per-process LocMemCache fallback can't be
+    invalidated in other workers, which would serve a stale answer.
+    """
+    if not settings.REDIS_URL:
+        return StravaToken.objects.filter(user=user).exists()
+    return cache.get_or_set(
+        has_strava_cache_key(user.pk),
+        lambda: StravaToken.objects.filter(user=user).exists(),
+        HAS_STRAVA_CACHE_TTL,
+    )
 
 
 @login_required
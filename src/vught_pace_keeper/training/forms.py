@@ -1,15 +1,78 @@
 """Forms for training plan management."""
 
+import codecs
 from datetime import date, timedelta
 from decimal import Decimal
 
 from django import forms
 from django.core.exceptions import ValidationError
+from django.utils.functional import lazy
 
 from .generators import PlanGeneratorRegistry
+from .gpx_utils import GPXData
 from .models import CompletedWorkout, Goal, PaceZone, PersonalRecord, ScheduledWorkout, TrainingPlan, UserFitnessSettings
 
 
+def _today_isoformat() -> str:
+    return date.today().isoformat()
+
+
+# Today's date for date picker min/max attrs, evaluated each time a widget is
+# rendered rather than once when this module is imported (which would freeze
+# the bound at the day the worker process started)
+lazy_today = lazy(_today_isoformat, str)
+
+
+def _hms_seconds(cleaned_data: dict, prefix: str) -> int:
+    """Total seconds from the optional "<prefix>hours/minutes/seconds" fields."""
+    get = cleaned_data.get
+    return (
+        (get(f"{prefix}hours") or 0) * 3600
+        + (get(f"{prefix}minutes") or 0) * 60
+        + (get(f"{prefix}seconds") or 0)
+    )
+
+
+def _pace_from_minutes_seconds(minutes: int, seconds: int) -> Decimal:
+    """Convert a M:SS pace to decimal minutes, e.g. 5:30 -> Decimal("5.50")."""
+    # seconds / 60 min in hundredths is seconds * 5/3; thirds never tie
+    return Decimal(minutes * 100 + round(seconds * 5 / 3)).scaleb(-2)
+
+
+def _minutes_seconds_from_pace(pace: Decimal) -> tuple[int, int]:
+    """Split a decimal min/km pace into (minutes, seconds), e.g. 5.50 -> (5, 30)."""
+    minutes, hundredths = divmod(int(pace * 100), 100)
+    # Round to the nearest second so M:SS -> decimal -> M:SS round-trips
+    return minutes, (hundredths * 60 + 50) // 100
+
+
+def _pace_min_per_km(duration_seconds: int, distance_km: Decimal) -> Decimal:
+    """Average pace in decimal minutes per km, rounded half up to two places."""
+    # Exact integer arithmetic: (seconds / 60) / (hundredths of km / 100) in
+    # hundredths of a minute is seconds * 500 / (3 * hundredths of km)
+    numerator = duration_seconds * 500
+    denominator = 3 * int(distance_km * 100)
+    return Decimal((2 * numerator + denominator) // (2 * denominator)).scaleb(-2)
+
+
+# Attrs for the small number inputs that make up H:MM:SS times and M:SS
+# paces; widgets copy attrs on init, so these dicts can be shared
+TIME_INPUT_ATTRS = {"class": "form-input w-16 text-center"}
+HOURS_INPUT_ATTRS = {**TIME_INPUT_ATTRS, "placeholder": "H"}
+MINUTES_INPUT_ATTRS = {**TIME_INPUT_ATTRS, "placeholder": "MM"}
+SECONDS_INPUT_ATTRS = {**TIME_INPUT_ATTRS, "placeholder": "SS"}
+PACE_MINUTES_INPUT_ATTRS = {**TIME_INPUT_ATTRS, "placeholder": "M"}
+
+
+# Fallback if no generators registered yet
+FALLBACK_METHODOLOGY_CHOICES = (("custom", "Custom Plan"),)
+
+
+def _methodology_choices() -> tuple[tuple[str, str], ...]:
+    """Registered methodologies; the registry caches these until it changes."""
+    return PlanGeneratorRegistry.get_choices() or FALLBACK_METHODOLOGY_CHOICES
+
+
 class PlanWizardStep1Form(forms.Form):
     """Step 1: Select distance and methodology."""
 
@@ -19,21 +82,11 @@ class PlanWizardStep1Form(forms.Form):
         label="Race Distance",
     )
     methodology = forms.ChoiceField(
-        choices=[],  # Populated dynamically in __init__
+        choices=_methodology_choices,  # Resolved from the registry when used
         widget=forms.RadioSelect(attrs={"class": "hidden peer"}),
         label="Training Methodology",
     )
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        # Get methodology choices from registry
-        choices = PlanGeneratorRegistry.get_choices()
-        if choices:
-            self.fields["methodology"].choices = choices
-        else:
-            # Fallback if no generators registered yet
-            self.fields["methodology"].choices = [("custom", "Custom Plan")]
-
 
 class PlanWizardStep2Form(forms.Form):
     """Step 2: Set race date and goal time."""
@@ -55,7 +108,7 @@ class PlanWizardStep2Form(forms.Form):
             attrs={
                 "type": "date",
                 "class": "form-input",
-                "min": date.today().isoformat(),
+                "min": lazy_today(),
             }
         ),
         label="Race Date",
@@ -64,39 +117,41 @@ class PlanWizardStep2Form(forms.Form):
         min_value=0,
         max_value=10,
         required=False,
-        widget=forms.NumberInput(
-            attrs={
-                "class": "form-input w-16 text-center",
-                "placeholder": "H",
-            }
-        ),
+        widget=forms.NumberInput(attrs=HOURS_INPUT_ATTRS),
         label="Hours",
     )
     goal_time_minutes = forms.IntegerField(
         min_value=0,
         max_value=59,
         required=False,
-        widget=forms.NumberInput(
-            attrs={
-                "class": "form-input w-16 text-center",
-                "placeholder": "MM",
-            }
-        ),
+        widget=forms.NumberInput(attrs=MINUTES_INPUT_ATTRS),
         label="Minutes",
     )
     goal_time_seconds = forms.IntegerField(
         min_value=0,
         max_value=59,
         required=False,
-        widget=forms.NumberInput(
-            attrs={
-                "class": "form-input w-16 text-center",
-                "placeholder": "SS",
-            }
-        ),
+        widget=forms.NumberInput(attrs=SECONDS_INPUT_ATTRS),
         label="Seconds",
     )
 
+    # Plausible goal time range per plan type: (min seconds, max seconds,
+    # too-fast message, too-slow message)
+    GOAL_TIME_BOUNDS = {
+        "half_marathon": (
+            1 * 3600,
+            4 * 3600,
+            "Half marathon goal under 1 hour is faster than the world record.",
+            "Half marathon goal over 4 hours exceeds typical race cutoffs.",
+        ),
+        "full_marathon": (
+            2 * 3600,
+            7 * 3600,
+            "Marathon goal under 2 hours is faster than the world record.",
+            "Marathon goal over 7 hours exceeds typical race cutoffs.",
+        ),
+    }
+
     def __init__(self, *args, plan_type=None, methodology=None, **kwargs):
         super().__init__(*args, **kwargs)
         self.plan_type = plan_type
@@ -104,150 +159,144 @@ class PlanWizardStep2Form(forms.Form):
 
     def clean_race_date(self):
         race_date = self.cleaned_data["race_date"]
+        today = date.today()
 
-        if race_date <= date.today():
+        if race_date <= today:
             raise ValidationError("Race date must be in the future.")
 
         # Check minimum weeks based on methodology
-        if self.methodology:
-            generator = PlanGeneratorRegistry.get_generator(self.methodology)
-            if generator:
-                min_weeks = generator.min_weeks.get(self.plan_type, 8)
-                weeks_until = (race_date - date.today()).days // 7
-                if weeks_until < min_weeks:
-                    raise ValidationError(
-                        f"At least {min_weeks} weeks required for this plan. "
-                        f"You have {weeks_until} weeks until race day."
-                    )
+        min_weeks = PlanGeneratorRegistry.min_weeks_for(
+            self.methodology, self.plan_type
+        )
+        if min_weeks is not None:
+            weeks_until = (race_date.toordinal() - today.toordinal()) // 7
+            if weeks_until < min_weeks:
+                raise ValidationError(
+                    f"At least {min_weeks} weeks required for this plan. "
+                    f"You have {weeks_until} weeks until race day."
+                )
 
         return race_date
 
     def clean(self):
         cleaned_data = super().clean()
-        hours = cleaned_data.get("goal_time_hours") or 0
-        minutes = cleaned_data.get("goal_time_minutes") or 0
-        seconds = cleaned_data.get("goal_time_seconds") or 0
+        goal_seconds = _hms_seconds(cleaned_data, "goal_time_")
 
         # Only validate goal time if any component is provided
-        if hours or minutes or seconds:
-            goal_time = timedelta(hours=hours, minutes=minutes, seconds=seconds)
-            cleaned_data["goal_time"] = goal_time
-
+        if goal_seconds:
             # Sanity checks based on plan type
-            plan_type = self.plan_type
-            if plan_type == "half_marathon":
-                if goal_time < timedelta(hours=1):
-                    raise ValidationError(
-                        "Half marathon goal under 1 hour is faster than the world record."
-                    )
-                if goal_time > timedelta(hours=4):
-                    raise ValidationError(
-                        "Half marathon goal over 4 hours exceeds typical race cutoffs."
-                    )
-            elif plan_type == "full_marathon":
-                if goal_time < timedelta(hours=2):
-                    raise ValidationError(
-                        "Marathon goal under 2 hours is faster than the world record."
-                    )
-                if goal_time > timedelta(hours=7):
-                    raise ValidationError(
-                        "Marathon goal over 7 hours exceeds typical race cutoffs."
-                    )
+            bounds = self.GOAL_TIME_BOUNDS.get(self.plan_type)
+            if bounds is not None:
+                min_seconds, max_seconds, too_fast, too_slow = bounds
+                if goal_seconds < min_seconds:
+                    raise ValidationError(too_fast)
+                if goal_seconds > max_seconds:
+                    raise ValidationError(too_slow)
+
+            cleaned_data["goal_time"] = timedelta(seconds=goal_seconds)
         else:
             cleaned_data["goal_time"] = None
 
         return cleaned_data
 
 
-class WorkoutEditForm(forms.ModelForm):
-    """Form for inline editing of scheduled workouts."""
+class WorkoutEditForm(forms.Form):
+    """
+    Form for inline editing of scheduled workouts.
 
-    class Meta:
-        model = ScheduledWorkout
-        fields = [
-            "workout_type",
-            "target_distance_km",
-            "target_duration",
-            "target_pace_min_per_km",
-            "description",
-        ]
-        widgets = {
-            "workout_type": forms.Select(
-                attrs={"class": "form-input"}
-            ),
-            "target_distance_km": forms.NumberInput(
-                attrs={
-                    "class": "form-input",
-                    "step": "0.1",
-                    "placeholder": "km",
-                }
-            ),
-            "target_duration": forms.TextInput(
-                attrs={
-                    "class": "form-input",
-                    "placeholder": "HH:MM:SS",
-                }
-            ),
-            "target_pace_min_per_km": forms.NumberInput(
-                attrs={
-                    "class": "form-input",
-                    "step": "0.01",
-                    "placeholder": "min/km",
-                }
-            ),
-            "description": forms.Textarea(
-                attrs={
-                    "class": "form-input",
-                    "rows": 2,
-                    "placeholder": "Workout notes...",
-                }
-            ),
-        }
+    A plain Form rather than a ModelForm: the view copies cleaned_data onto
+    the workout itself, which skips model_to_dict and the model full_clean
+    on every render/submit.
+    """
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        # Make all fields optional for flexibility
-        for field in self.fields.values():
-            field.required = False
+    # ScheduledWorkout attributes this form reads and writes
+    FIELDS = (
+        "workout_type",
+        "target_distance_km",
+        "target_duration",
+        "target_pace_min_per_km",
+        "description",
+    )
+
+    # Optional like every field here; when omitted the view keeps the
+    # workout's current type, since the model field can't be blank
+    workout_type = forms.ChoiceField(
+        choices=ScheduledWorkout.WorkoutType.choices,
+        required=False,
+        widget=forms.Select(attrs={"class": "form-input"}),
+    )
+    target_distance_km = forms.DecimalField(
+        max_digits=6,
+        decimal_places=2,
+        required=False,
+        widget=forms.NumberInput(
+            attrs={
+                "class": "form-input",
+                "step": "0.1",
+                "placeholder": "km",
+            }
+        ),
+    )
+    target_duration = forms.DurationField(
+        required=False,
+        widget=forms.TextInput(
+            attrs={
+                "class": "form-input",
+                "placeholder": "HH:MM:SS",
+            }
+        ),
+    )
+    target_pace_min_per_km = forms.DecimalField(
+        max_digits=5,
+        decimal_places=2,
+        required=False,
+        widget=forms.NumberInput(
+            attrs={
+                "class": "form-input",
+                "step": "0.01",
+                "placeholder": "min/km",
+            }
+        ),
+    )
+    description = forms.CharField(
+        required=False,
+        widget=forms.Textarea(
+            attrs={
+                "class": "form-input",
+                "rows": 2,
+                "placeholder": "Workout notes...",
+            }
+        ),
+    )
 
 
 class ManualWorkoutForm(forms.ModelForm):
-    """Form for manually logging a completed workout."""
+    """
+    Form for manually logging a completed workout.
+
+    A scheduled_workout passed in for prefilling should be fetched with
+    select_related("week__plan"); its date is derived from the plan.
+    """
 
     duration_hours = forms.IntegerField(
         min_value=0,
         max_value=23,
         required=False,
         initial=0,
-        widget=forms.NumberInput(
-            attrs={
-                "class": "form-input w-16 text-center",
-                "placeholder": "H",
-            }
-        ),
+        widget=forms.NumberInput(attrs=HOURS_INPUT_ATTRS),
     )
     duration_minutes = forms.IntegerField(
         min_value=0,
         max_value=59,
         required=True,
-        widget=forms.NumberInput(
-            attrs={
-                "class": "form-input w-16 text-center",
-                "placeholder": "MM",
-            }
-        ),
+        widget=forms.NumberInput(attrs=MINUTES_INPUT_ATTRS),
     )
     duration_seconds = forms.IntegerField(
         min_value=0,
         max_value=59,
         required=False,
         initial=0,
-        widget=forms.NumberInput(
-            attrs={
-                "class": "form-input w-16 text-center",
-                "placeholder": "SS",
-            }
-        ),
+        widget=forms.NumberInput(attrs=SECONDS_INPUT_ATTRS),
     )
 
     class Meta:
@@ -264,7 +313,7 @@ class ManualWorkoutForm(forms.ModelForm):
                 attrs={
                     "type": "date",
                     "class": "form-input",
-                    "max": date.today().isoformat(),
+                    "max": lazy_today(),
                 }
             ),
             "actual_distance_km": forms.NumberInput(
@@ -306,36 +355,40 @@ class ManualWorkoutForm(forms.ModelForm):
         # Pre-fill from scheduled workout if provided
         if scheduled_workout and not self.data:
             if scheduled_workout.target_distance_km:
-                self.fields["actual_distance_km"].initial = scheduled_workout.target_distance_km
+                self.initial["actual_distance_km"] = scheduled_workout.target_distance_km
 
             # Calculate the actual date this workout should be done
-            plan = scheduled_workout.week.plan
+            week = scheduled_workout.week
+            plan = week.plan
             if plan.target_race_date:
-                plan_start = plan.target_race_date - timedelta(weeks=plan.duration_weeks)
-                week_start = plan_start + timedelta(weeks=scheduled_workout.week.week_number - 1)
-                workout_date = week_start + timedelta(days=scheduled_workout.day_of_week - 1)
-                self.fields["date"].initial = workout_date.isoformat()
+                # Plan start + (week_number - 1) weeks + (day_of_week - 1) days
+                offset_days = (
+                    7 * (week.week_number - 1 - plan.duration_weeks)
+                    + scheduled_workout.day_of_week
+                    - 1
+                )
+                workout_date = date.fromordinal(
+                    plan.target_race_date.toordinal() + offset_days
+                )
+                self.initial["date"] = workout_date.isoformat()
 
     def clean(self):
         cleaned_data = super().clean()
 
         # Combine duration fields
-        hours = cleaned_data.get("duration_hours") or 0
-        minutes = cleaned_data.get("duration_minutes") or 0
-        seconds = cleaned_data.get("duration_seconds") or 0
+        duration_seconds = _hms_seconds(cleaned_data, "duration_")
 
-        if not (hours or minutes or seconds):
+        if not duration_seconds:
             raise ValidationError("Duration is required.")
 
-        actual_duration = timedelta(hours=hours, minutes=minutes, seconds=seconds)
-        cleaned_data["actual_duration"] = actual_duration
+        cleaned_data["actual_duration"] = timedelta(seconds=duration_seconds)
 
         # Calculate pace if distance and duration provided
         distance = cleaned_data.get("actual_distance_km")
         if distance and distance > 0:
-            duration_minutes_total = actual_duration.total_seconds() / 60
-            pace = Decimal(str(round(duration_minutes_total / float(distance), 2)))
-            cleaned_data["average_pace_min_per_km"] = pace
+            cleaned_data["average_pace_min_per_km"] = _pace_min_per_km(
+                duration_seconds, distance
+            )
         else:
             raise ValidationError("Distance must be greater than 0.")
 
@@ -372,20 +425,45 @@ class GPXUploadForm(forms.Form):
         help_text="Upload a .gpx file (max 10MB)",
     )
 
+    MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
+    # Leading bytes checked for the start of an XML document
+    SNIFF_BYTES = 1024
+    # Byte order marks a GPX file may start with, and their encodings
+    XML_BOMS = (
+        (codecs.BOM_UTF8, "utf-8"),
+        (codecs.BOM_UTF16_LE, "utf-16-le"),
+        (codecs.BOM_UTF16_BE, "utf-16-be"),
+    )
+
     def clean_gpx_file(self):
         gpx_file = self.cleaned_data["gpx_file"]
 
-        # Check file extension
-        if not gpx_file.name.lower().endswith(".gpx"):
+        # Check file size first; it's a plain attribute read
+        if gpx_file.size > self.MAX_FILE_SIZE:
+            raise ValidationError("File size must be under 10MB.")
+
+        # Check file extension (case-insensitive, e.g. ".GPX" from some devices)
+        if gpx_file.name[-4:].lower() != ".gpx":
             raise ValidationError("File must be a .gpx file.")
 
-        # Check file size (10MB limit)
-        max_size = 10 * 1024 * 1024
-        if gpx_file.size > max_size:
-            raise ValidationError("File size must be under 10MB.")
+        # Reject content that isn't XML at all before it reaches the parser;
+        # anything else is left to parse_gpx_file()
+        head = gpx_file.read(self.SNIFF_BYTES)
+        gpx_file.seek(0)
+        if not self._looks_like_xml(head):
+            raise ValidationError("Not a valid GPX file.")
 
         return gpx_file
 
+    @classmethod
+    def _looks_like_xml(cls, head: bytes) -> bool:
+        """Whether head, after any BOM and whitespace, starts with "<"."""
+        for bom, encoding in cls.XML_BOMS:
+            if head.startswith(bom):
+                text = head[len(bom) :].decode(encoding, errors="ignore")
+                return text.lstrip().startswith("<")
+        return head.lstrip().startswith(b"<")
+
 
 class GPXConfirmForm(forms.ModelForm):
     """Form for confirming/editing GPX-parsed workout data."""
@@ -394,31 +472,19 @@ class GPXConfirmForm(forms.ModelForm):
         min_value=0,
         max_value=23,
         required=False,
-        widget=forms.NumberInput(
-            attrs={
-                "class": "form-input w-16 text-center",
-            }
-        ),
+        widget=forms.NumberInput(attrs=TIME_INPUT_ATTRS),
     )
     duration_minutes = forms.IntegerField(
         min_value=0,
         max_value=59,
         required=True,
-        widget=forms.NumberInput(
-            attrs={
-                "class": "form-input w-16 text-center",
-            }
-        ),
+        widget=forms.NumberInput(attrs=TIME_INPUT_ATTRS),
     )
     duration_seconds = forms.IntegerField(
         min_value=0,
         max_value=59,
         required=False,
-        widget=forms.NumberInput(
-            attrs={
-                "class": "form-input w-16 text-center",
-            }
-        ),
+        widget=forms.NumberInput(attrs=TIME_INPUT_ATTRS),
     )
 
     class Meta:
@@ -472,46 +538,50 @@ class GPXConfirmForm(forms.ModelForm):
             ),
         }
 
-    def __init__(self, *args, gpx_data=None, scheduled_workout=None, **kwargs):
+    def __init__(
+        self,
+        *args,
+        gpx_data: GPXData | None = None,
+        scheduled_workout: ScheduledWorkout | None = None,
+        **kwargs,
+    ):
         super().__init__(*args, **kwargs)
         self.gpx_data = gpx_data
         self.scheduled_workout = scheduled_workout
 
         # Pre-fill from GPX data if provided
         if gpx_data and not self.data:
-            self.fields["actual_distance_km"].initial = gpx_data.distance_km
-            self.fields["elevation_gain_m"].initial = gpx_data.elevation_gain_m
+            hours, remainder = divmod(int(gpx_data.duration.total_seconds()), 3600)
+            minutes, seconds = divmod(remainder, 60)
+            self.initial.update(
+                actual_distance_km=gpx_data.distance_km,
+                elevation_gain_m=gpx_data.elevation_gain_m,
+                duration_hours=hours,
+                duration_minutes=minutes,
+                duration_seconds=seconds,
+            )
 
             # Set date from GPX start time
             if gpx_data.start_time:
-                self.fields["date"].initial = gpx_data.start_time.date().isoformat()
-
-            # Set duration fields
-            total_seconds = int(gpx_data.duration.total_seconds())
-            self.fields["duration_hours"].initial = total_seconds // 3600
-            self.fields["duration_minutes"].initial = (total_seconds % 3600) // 60
-            self.fields["duration_seconds"].initial = total_seconds % 60
+                self.initial["date"] = gpx_data.start_time.date().isoformat()
 
     def clean(self):
         cleaned_data = super().clean()
 
         # Combine duration fields
-        hours = cleaned_data.get("duration_hours") or 0
-        minutes = cleaned_data.get("duration_minutes") or 0
-        seconds = cleaned_data.get("duration_seconds") or 0
+        duration_seconds = _hms_seconds(cleaned_data, "duration_")
 
-        if not (hours or minutes or seconds):
+        if not duration_seconds:
             raise ValidationError("Duration is required.")
 
-        actual_duration = timedelta(hours=hours, minutes=minutes, seconds=seconds)
-        cleaned_data["actual_duration"] = actual_duration
+        cleaned_data["actual_duration"] = timedelta(seconds=duration_seconds)
 
         # Calculate pace
         distance = cleaned_data.get("actual_distance_km")
         if distance and distance > 0:
-            duration_minutes_total = actual_duration.total_seconds() / 60
-            pace = Decimal(str(round(duration_minutes_total / float(distance), 2)))
-            cleaned_data["average_pace_min_per_km"] = pace
+            cleaned_data["average_pace_min_per_km"] = _pace_min_per_km(
+                duration_seconds, distance
+            )
         else:
             raise ValidationError("Distance must be greater than 0.")
 
@@ -538,18 +608,50 @@ class GPXConfirmForm(forms.ModelForm):
 # Pace Zone Calculator Forms
 
 
-RACE_DISTANCE_CHOICES = [
+class TimeFieldsForm(forms.Form):
+    """
+    Base for forms that take an H:MM:SS time as three number inputs.
+
+    Provides time_hours, time_minutes and time_seconds; read the total with
+    _hms_seconds(cleaned_data, "time_").
+    """
+
+    time_hours = forms.IntegerField(
+        min_value=0,
+        max_value=24,
+        required=False,
+        initial=0,
+        widget=forms.NumberInput(attrs=HOURS_INPUT_ATTRS),
+    )
+    time_minutes = forms.IntegerField(
+        min_value=0,
+        max_value=59,
+        required=True,
+        widget=forms.NumberInput(attrs=MINUTES_INPUT_ATTRS),
+    )
+    time_seconds = forms.IntegerField(
+        min_value=0,
+        max_value=59,
+        required=False,
+        initial=0,
+        widget=forms.NumberInput(attrs=SECONDS_INPUT_ATTRS),
+    )
+
+
+RACE_DISTANCE_CHOICES = (
     ("5k", "5K"),
     ("10k", "10K"),
     ("half_marathon", "Half Marathon"),
     ("marathon", "Marathon"),
     ("custom", "Custom Distance"),
-]
+)
 
 
-class RaceResultForm(forms.Form):
+class RaceResultForm(TimeFieldsForm):
     """Form for calculating pace zones from a race result."""
 
+    field_order = ["distance", "custom_distance_km"]
+
     distance = forms.ChoiceField(
         choices=RACE_DISTANCE_CHOICES,
         widget=forms.RadioSelect(attrs={"class": "hidden peer"}),
@@ -569,40 +671,13 @@ class RaceResultForm(forms.Form):
         ),
         label="Custom Distance (km)",
     )
+    # Race results are capped at 10 hours
     time_hours = forms.IntegerField(
         min_value=0,
         max_value=10,
         required=False,
         initial=0,
-        widget=forms.NumberInput(
-            attrs={
-                "class": "form-input w-16 text-center",
-                "placeholder": "H",
-            }
-        ),
-    )
-    time_minutes = forms.IntegerField(
-        min_value=0,
-        max_value=59,
-        required=True,
-        widget=forms.NumberInput(
-            attrs={
-                "class": "form-input w-16 text-center",
-                "placeholder": "MM",
-            }
-        ),
-    )
-    time_seconds = forms.IntegerField(
-        min_value=0,
-        max_value=59,
-        required=False,
-        initial=0,
-        widget=forms.NumberInput(
-            attrs={
-                "class": "form-input w-16 text-center",
-                "placeholder": "SS",
-            }
-        ),
+        widget=forms.NumberInput(attrs=HOURS_INPUT_ATTRS),
     )
 
     def clean(self):
@@ -619,18 +694,15 @@ class RaceResultForm(forms.Form):
             cleaned_data["distance_value"] = distance
 
         # Combine time fields
-        hours = cleaned_data.get("time_hours") or 0
-        minutes = cleaned_data.get("time_minutes") or 0
-        seconds = cleaned_data.get("time_seconds") or 0
+        race_seconds = _hms_seconds(cleaned_data, "time_")
 
-        if not (hours or minutes or seconds):
+        if not race_seconds:
             raise ValidationError("Please enter a race time.")
 
-        race_time = timedelta(hours=hours, minutes=minutes, seconds=seconds)
-        cleaned_data["race_time"] = race_time
+        cleaned_data["race_time"] = timedelta(seconds=race_seconds)
 
         # Basic sanity check
-        if race_time.total_seconds() < 60:
+        if race_seconds < 60:
             raise ValidationError("Race time must be at least 1 minute.")
 
         return cleaned_data
@@ -642,12 +714,7 @@ class ThresholdPaceForm(forms.Form):
     pace_minutes = forms.IntegerField(
         min_value=2,
         max_value=15,
-        widget=forms.NumberInput(
-            attrs={
-                "class": "form-input w-16 text-center",
-                "placeholder": "M",
-            }
-        ),
+        widget=forms.NumberInput(attrs=PACE_MINUTES_INPUT_ATTRS),
         label="Minutes",
     )
     pace_seconds = forms.IntegerField(
@@ -655,12 +722,7 @@ class ThresholdPaceForm(forms.Form):
         max_value=59,
         required=False,
         initial=0,
-        widget=forms.NumberInput(
-            attrs={
-                "class": "form-input w-16 text-center",
-                "placeholder": "SS",
-            }
-        ),
+        widget=forms.NumberInput(attrs=SECONDS_INPUT_ATTRS),
         label="Seconds",
     )
 
@@ -673,8 +735,7 @@ class ThresholdPaceForm(forms.Form):
             raise ValidationError("Please enter pace minutes.")
 
         # Convert to decimal min/km (e.g., 5:30 -> 5.50)
-        pace_decimal = Decimal(str(minutes)) + Decimal(str(seconds)) / Decimal("60")
-        cleaned_data["threshold_pace"] = pace_decimal.quantize(Decimal("0.01"))
+        cleaned_data["threshold_pace"] = _pace_from_minutes_seconds(minutes, seconds)
 
         return cleaned_data
 
@@ -685,32 +746,24 @@ class ZoneOverrideForm(forms.ModelForm):
     min_pace_minutes = forms.IntegerField(
         min_value=2,
         max_value=15,
-        widget=forms.NumberInput(
-            attrs={"class": "form-input w-16 text-center"}
-        ),
+        widget=forms.NumberInput(attrs=TIME_INPUT_ATTRS),
     )
     min_pace_seconds = forms.IntegerField(
         min_value=0,
         max_value=59,
         required=False,
-        widget=forms.NumberInput(
-            attrs={"class": "form-input w-16 text-center"}
-        ),
+        widget=forms.NumberInput(attrs=TIME_INPUT_ATTRS),
     )
     max_pace_minutes = forms.IntegerField(
         min_value=2,
         max_value=15,
-        widget=forms.NumberInput(
-            attrs={"class": "form-input w-16 text-center"}
-        ),
+        widget=forms.NumberInput(attrs=TIME_INPUT_ATTRS),
     )
     max_pace_seconds = forms.IntegerField(
         min_value=0,
         max_value=59,
         required=False,
-        widget=forms.NumberInput(
-            attrs={"class": "form-input w-16 text-center"}
-        ),
+        widget=forms.NumberInput(attrs=TIME_INPUT_ATTRS),
     )
 
     class Meta:
@@ -722,13 +775,17 @@ class ZoneOverrideForm(forms.ModelForm):
 
         # Pre-fill from instance
         if self.instance and self.instance.pk:
-            min_pace = float(self.instance.min_pace_min_per_km)
-            max_pace = float(self.instance.max_pace_min_per_km)
+            min_minutes, min_seconds = _minutes_seconds_from_pace(
+                self.instance.min_pace_min_per_km
+            )
+            max_minutes, max_seconds = _minutes_seconds_from_pace(
+                self.instance.max_pace_min_per_km
+            )
 
-            self.fields["min_pace_minutes"].initial = int(min_pace)
-            self.fields["min_pace_seconds"].initial = int((min_pace % 1) * 60)
-            self.fields["max_pace_minutes"].initial = int(max_pace)
-            self.fields["max_pace_seconds"].initial = int((max_pace % 1) * 60)
+            self.fields["min_pace_minutes"].initial = min_minutes
+            self.fields["min_pace_seconds"].initial = min_seconds
+            self.fields["max_pace_minutes"].initial = max_minutes
+            self.fields["max_pace_seconds"].initial = max_seconds
 
     def clean(self):
         cleaned_data = super().clean()
@@ -742,8 +799,8 @@ class ZoneOverrideForm(forms.ModelForm):
         if min_minutes is None or max_minutes is None:
             raise ValidationError("Please enter both min and max pace.")
 
-        min_pace = Decimal(str(min_minutes)) + Decimal(str(min_seconds)) / Decimal("60")
-        max_pace = Decimal(str(max_minutes)) + Decimal(str(max_seconds)) / Decimal("60")
+        min_pace = _pace_from_minutes_seconds(min_minutes, min_seconds)
+        max_pace = _pace_from_minutes_seconds(max_minutes, max_seconds)
 
         # Note: slower pace = higher number, so min_pace should be > max_pace
         if min_pace <= max_pace:
@@ -751,8 +808,8 @@ class ZoneOverrideForm(forms.ModelForm):
                 "Min pace (slower) must be greater than max pace (faster)."
             )
 
-        cleaned_data["min_pace_min_per_km"] = min_pace.quantize(Decimal("0.01"))
-        cleaned_data["max_pace_min_per_km"] = max_pace.quantize(Decimal("0.01"))
+        cleaned_data["min_pace_min_per_km"] = min_pace
+        cleaned_data["max_pace_min_per_km"] = max_pace
 
         return cleaned_data
 
@@ -773,24 +830,14 @@ class FitnessSettingsForm(forms.ModelForm):
         min_value=2,
         max_value=15,
         required=False,
-        widget=forms.NumberInput(
-            attrs={
-                "class": "form-input w-16 text-center",
-                "placeholder": "M",
-            }
-        ),
+        widget=forms.NumberInput(attrs=PACE_MINUTES_INPUT_ATTRS),
         label="Minutes",
     )
     threshold_pace_seconds = forms.IntegerField(
         min_value=0,
         max_value=59,
         required=False,
-        widget=forms.NumberInput(
-            attrs={
-                "class": "form-input w-16 text-center",
-                "placeholder": "SS",
-            }
-        ),
+        widget=forms.NumberInput(attrs=SECONDS_INPUT_ATTRS),
         label="Seconds",
     )
 
@@ -838,9 +885,9 @@ class FitnessSettingsForm(forms.ModelForm):
 
         # Pre-fill threshold pace if set
         if self.instance and self.instance.pk and self.instance.threshold_pace:
-            pace = float(self.instance.threshold_pace)
-            self.fields["threshold_pace_minutes"].initial = int(pace)
-            self.fields["threshold_pace_seconds"].initial = int((pace % 1) * 60)
+            minutes, seconds = _minutes_seconds_from_pace(self.instance.threshold_pace)
+            self.fields["threshold_pace_minutes"].initial = minutes
+            self.fields["threshold_pace_seconds"].initial = seconds
 
     def clean(self):
         cleaned_data = super().clean()
@@ -850,8 +897,9 @@ class FitnessSettingsForm(forms.ModelForm):
         seconds = cleaned_data.get("threshold_pace_seconds") or 0
 
         if minutes:
-            pace_decimal = Decimal(str(minutes)) + Decimal(str(seconds)) / Decimal("60")
-            cleaned_data["threshold_pace"] = pace_decimal.quantize(Decimal("0.01"))
+            cleaned_data["threshold_pace"] = _pace_from_minutes_seconds(
+                minutes, seconds
+            )
         else:
             cleaned_data["threshold_pace"] = None
 
@@ -866,9 +914,11 @@ class FitnessSettingsForm(forms.ModelForm):
         return instance
 
 
-class ManualRecordForm(forms.Form):
+class ManualRecordForm(TimeFieldsForm):
     """Form for manually adding a personal record."""
 
+    field_order = ["distance", "custom_distance_km"]
+
     distance = forms.ChoiceField(
         choices=PersonalRecord.Distance.choices,
         widget=forms.RadioSelect(attrs={"class": "hidden peer"}),
@@ -888,47 +938,12 @@ class ManualRecordForm(forms.Form):
         ),
         label="Custom Distance (km)",
     )
-    time_hours = forms.IntegerField(
-        min_value=0,
-        max_value=24,
-        required=False,
-        initial=0,
-        widget=forms.NumberInput(
-            attrs={
-                "class": "form-input w-16 text-center",
-                "placeholder": "H",
-            }
-        ),
-    )
-    time_minutes = forms.IntegerField(
-        min_value=0,
-        max_value=59,
-        required=True,
-        widget=forms.NumberInput(
-            attrs={
-                "class": "form-input w-16 text-center",
-                "placeholder": "MM",
-            }
-        ),
-    )
-    time_seconds = forms.IntegerField(
-        min_value=0,
-        max_value=59,
-        required=False,
-        initial=0,
-        widget=forms.NumberInput(
-            attrs={
-                "class": "form-input w-16 text-center",
-                "placeholder": "SS",
-            }
-        ),
-    )
     record_date = forms.DateField(
         widget=forms.DateInput(
             attrs={
                 "type": "date",
                 "class": "form-input",
-                "max": date.today().isoformat(),
+                "max": lazy_today(),
             }
         ),
         label="Date",
@@ -943,15 +958,12 @@ class ManualRecordForm(forms.Form):
             raise ValidationError("Please enter a custom distance.")
 
         # Combine time fields
-        hours = cleaned_data.get("time_hours") or 0
-        minutes = cleaned_data.get("time_minutes") or 0
-        seconds = cleaned_data.get("time_seconds") or 0
+        record_seconds = _hms_seconds(cleaned_data, "time_")
 
-        if not (hours or minutes or seconds):
+        if not record_seconds:
             raise ValidationError("Please enter a time.")
 
-        record_time = timedelta(hours=hours, minutes=minutes, seconds=seconds)
-        cleaned_data["record_time"] = record_time
+        cleaned_data["record_time"] = timedelta(seconds=record_seconds)
 
         return cleaned_data
 
@@ -963,56 +975,31 @@ class GoalForm(forms.ModelForm):
         min_value=0,
         max_value=24,
         required=False,
-        widget=forms.NumberInput(
-            attrs={
-                "class": "form-input w-16 text-center",
-                "placeholder": "H",
-            }
-        ),
+        widget=forms.NumberInput(attrs=HOURS_INPUT_ATTRS),
     )
     target_time_minutes = forms.IntegerField(
         min_value=0,
         max_value=59,
         required=False,
-        widget=forms.NumberInput(
-            attrs={
-                "class": "form-input w-16 text-center",
-                "placeholder": "MM",
-            }
-        ),
+        widget=forms.NumberInput(attrs=MINUTES_INPUT_ATTRS),
     )
     target_time_seconds = forms.IntegerField(
         min_value=0,
         max_value=59,
         required=False,
-        widget=forms.NumberInput(
-            attrs={
-                "class": "form-input w-16 text-center",
-                "placeholder": "SS",
-            }
-        ),
+        widget=forms.NumberInput(attrs=SECONDS_INPUT_ATTRS),
     )
     target_pace_minutes = forms.IntegerField(
         min_value=2,
         max_value=15,
         required=False,
-        widget=forms.NumberInput(
-            attrs={
-                "class": "form-input w-16 text-center",
-                "placeholder": "M",
-            }
-        ),
+        widget=forms.NumberInput(attrs=PACE_MINUTES_INPUT_ATTRS),
     )
     target_pace_seconds = forms.IntegerField(
         min_value=0,
         max_value=59,
         required=False,
-        widget=forms.NumberInput(
-            attrs={
-                "class": "form-input w-16 text-center",
-                "placeholder": "SS",
-            }
-        ),
+        widget=forms.NumberInput(attrs=SECONDS_INPUT_ATTRS),
     )
 
     class Meta:
@@ -1045,7 +1032,7 @@ class GoalForm(forms.ModelForm):
                 attrs={
                     "type": "date",
                     "class": "form-input",
-                    "min": date.today().isoformat(),
+                    "min": lazy_today(),
                 }
             ),
             "notes": forms.Textarea(
@@ -1069,9 +1056,9 @@ class GoalForm(forms.ModelForm):
                 self.fields["target_time_seconds"].initial = total_seconds % 60
 
             if self.instance.target_pace:
-                pace = float(self.instance.target_pace)
-                self.fields["target_pace_minutes"].initial = int(pace)
-                self.fields["target_pace_seconds"].initial = int((pace % 1) * 60)
+                minutes, seconds = _minutes_seconds_from_pace(self.instance.target_pace)
+                self.fields["target_pace_minutes"].initial = minutes
+                self.fields["target_pace_seconds"].initial = seconds
 
     def clean(self):
         cleaned_data = super().clean()
@@ -1082,16 +1069,12 @@ class GoalForm(forms.ModelForm):
             if not cleaned_data.get("race_distance"):
                 raise ValidationError("Please select a race distance.")
 
-            hours = cleaned_data.get("target_time_hours") or 0
-            minutes = cleaned_data.get("target_time_minutes") or 0
-            seconds = cleaned_data.get("target_time_seconds") or 0
+            target_seconds = _hms_seconds(cleaned_data, "target_time_")
 
-            if not (hours or minutes or seconds):
+            if not target_seconds:
                 raise ValidationError("Please enter a target time.")
 
-            cleaned_data["target_time"] = timedelta(
-                hours=hours, minutes=minutes, seconds=seconds
-            )
+            cleaned_data["target_time"] = timedelta(seconds=target_seconds)
 
         elif goal_type in ["weekly_km", "monthly_km"]:
             if not cleaned_data.get("target_distance_km"):
@@ -1107,8 +1090,7 @@ class GoalForm(forms.ModelForm):
             if not minutes:
                 raise ValidationError("Please enter a target pace.")
 
-            pace_decimal = Decimal(str(minutes)) + Decimal(str(seconds)) / Decimal("60")
-            cleaned_data["target_pace"] = pace_decimal.quantize(Decimal("0.01"))
+            cleaned_data["target_pace"] = _pace_from_minutes_seconds(minutes, seconds)
 
         return cleaned_data
 
@@ -10,7 +10,7 @@ if TYPE_CHECKING:
     from vught_pace_keeper.accounts.models import User
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FitnessProfile:
     """User's current fitness level for plan generation."""
 
@@ -20,7 +20,7 @@ class FitnessProfile:
     estimated_full_pace: timedelta | None = None  # per km
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PlanConfig:
     """Configuration for generating a training plan."""
 
@@ -32,7 +32,7 @@ class PlanConfig:
     name: str = ""
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GeneratedWorkout:
     """Preview data for a generated workout."""
 
@@ -44,7 +44,7 @@ class GeneratedWorkout:
     description: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class GeneratedWeek:
     """Preview data for a generated week."""
 
@@ -55,7 +55,7 @@ class GeneratedWeek:
     notes: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class GeneratedPlan:
     """Preview of a complete plan before saving to database."""
 
@@ -86,6 +86,35 @@ class BasePlanGenerator(ABC):
     min_weeks: dict[str, int] = {}  # {"half_marathon": 8, "full_marathon": 12}
     max_weeks: dict[str, int] = {}  # {"half_marathon": 20, "full_marathon": 30}
 
+    # Plausible goal time range per plan type: (fastest, slowest,
+    # too-fast message, too-slow message); built once, not per validation
+    GOAL_TIME_BOUNDS: dict[str, tuple[timedelta, timedelta, str, str]] = {
+        "half_marathon": (
+            timedelta(hours=1),
+            timedelta(hours=4),
+            (
+                "Half marathon goal time under 1 hour is faster than "
+                "the world record. Please enter a realistic goal."
+            ),
+            (
+                "Half marathon goal time over 4 hours exceeds typical "
+                "race cutoffs. Consider a more achievable goal."
+            ),
+        ),
+        "full_marathon": (
+            timedelta(hours=2),
+            timedelta(hours=7),
+            (
+                "Marathon goal time under 2 hours is faster than "
+                "the world record. Please enter a realistic goal."
+            ),
+            (
+                "Marathon goal time over 7 hours exceeds typical "
+                "race cutoffs. Consider a more achievable goal."
+            ),
+        ),
+    }
+
     @abstractmethod
     def generate_plan(self, config: PlanConfig) -> GeneratedPlan:
         """
@@ -159,27 +188,12 @@ class BasePlanGenerator(ABC):
         """Validate goal time is reasonable for the distance."""
         errors = []
 
-        if plan_type == "half_marathon":
-            if goal_time < timedelta(hours=1):
-                errors.append(
-                    "Half marathon goal time under 1 hour is faster than "
-                    "the world record. Please enter a realistic goal."
-                )
-            elif goal_time > timedelta(hours=4):
-                errors.append(
-                    "Half marathon goal time over 4 hours exceeds typical "
-                    "race cutoffs. Consider a more achievable goal."
-                )
-        elif plan_type == "full_marathon":
-            if goal_time < timedelta(hours=2):
-                errors.append(
-                    "Marathon goal time under 2 hours is faster than "
-                    "the world record. Please enter a realistic goal."
-                )
-            elif goal_time > timedelta(hours=7):
-                errors.append(
-                    "Marathon goal time over 7 hours exceeds typical "
-                    "race cutoffs. Consider a more achievable goal."
-                )
+        bounds = self.GOAL_TIME_BOUNDS.get(plan_type)
+        if bounds is not None:
+            fastest, slowest, too_fast, too_slow = bounds
+            if goal_time < fastest:
+                errors.append(too_fast)
+            elif goal_time > slowest:
+                errors.append(too_slow)
 
         return errors
@@ -15,32 +15,57 @@ class PlanGeneratorRegistry:
     """
 
     _generators: dict[str, "BasePlanGenerator"] = {}
+    # Built on first use and reset whenever the registry changes
+    _choices: tuple[tuple[str, str], ...] | None = None
+    # Flattened {(methodology, plan_type): min_weeks}, filled on register
+    _min_weeks: dict[tuple[str, str], int] = {}
+
+    # Minimum weeks assumed when a generator doesn't list the distance
+    DEFAULT_MIN_WEEKS = 8
 
     @classmethod
     def register(cls, generator: "BasePlanGenerator") -> None:
         """Register a generator instance."""
-        cls._generators[generator.methodology_name] = generator
+        name = generator.methodology_name
+        cls._generators[name] = generator
+        cls._choices = None
+        for plan_type, weeks in generator.min_weeks.items():
+            cls._min_weeks[(name, plan_type)] = weeks
 
     @classmethod
     def get_generator(cls, methodology: str) -> "BasePlanGenerator | None":
         """Get a generator by methodology name."""
         return cls._generators.get(methodology)
 
+    @classmethod
+    def min_weeks_for(cls, methodology: str, plan_type: str) -> int | None:
+        """
+        Get the minimum plan length in weeks for a methodology and distance.
+
+        Returns None if the methodology isn't registered.
+        """
+        if methodology not in cls._generators:
+            return None
+        return cls._min_weeks.get((methodology, plan_type), cls.DEFAULT_MIN_WEEKS)
+
     @classmethod
     def get_all_generators(cls) -> dict[str, "BasePlanGenerator"]:
         """Get all registered generators."""
         return cls._generators.copy()
 
     @classmethod
-    def get_choices(cls) -> list[tuple[str, str]]:
+    def get_choices(cls) -> tuple[tuple[str, str], ...]:
         """
         Get choices for form select fields.
 
-        Returns list of (methodology_name, display_name) tuples.
+        Returns (methodology_name, display_name) tuples, cached until the
+        registry changes.
         """
-        return [
-            (name, gen.display_name) for name, gen in cls._generators.items()
-        ]
+        if cls._choices is None:
+            cls._choices = tuple(
+                (name, gen.display_name) for name, gen in cls._generators.items()
+            )
+        return cls._choices
 
     @classmethod
     def get_for_distance(cls, plan_type: str) -> list["BasePlanGenerator"]:
@@ -55,6 +80,8 @@ class PlanGeneratorRegistry:
     def clear(cls) -> None:
         """Clear all registered generators. Useful for testing."""
         cls._generators.clear()
+        cls._choices = None
+        cls._min_weeks.clear()
 
 
 def register_generator(cls):
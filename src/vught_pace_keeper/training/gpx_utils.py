@@ -12,7 +12,7 @@ import gpxpy.gpx
 from django.contrib.gis.geos import LineString
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GPXData:
     """Parsed data from a GPX file."""
 
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.9 on 2026-10-15 10:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('training', '0004_add_records_and_goals'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='trainingplan',
+            index=models.Index(fields=['user', 'target_race_date'], name='training_tr_user_id_0b8264_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.9 on 2026-10-15 11:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('training', '0005_trainingplan_user_target_race_date_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='completedworkout',
+            name='strava_start_date',
+            field=models.DateTimeField(blank=True, help_text='Activity start time reported by Strava', null=True),
+        ),
+    ]
@@ -0,0 +1,77 @@
+# Generated by Django 5.2.9 on 2026-10-15 11:40
+
+from django.db import migrations
+
+import vught_pace_keeper.core.fields
+
+STREAM_FIELDS = {
+    'time_data': ('i', 'Seconds from start'),
+    'distance_data': ('d', 'Meters'),
+    'heartrate_data': ('i', 'BPM (may contain nulls)'),
+    'velocity_data': ('d', 'Meters per second'),
+    'altitude_data': ('d', 'Meters elevation'),
+}
+
+
+def compress_streams(apps, schema_editor):
+    ActivityStream = apps.get_model('training', 'ActivityStream')
+    streams = ActivityStream.objects.only('id', *STREAM_FIELDS)
+    batch = []
+    for stream in streams.iterator(chunk_size=100):
+        for name in STREAM_FIELDS:
+            setattr(stream, f'{name}_blob', getattr(stream, name) or [])
+        batch.append(stream)
+        if len(batch) == 100:
+            ActivityStream.objects.bulk_update(batch, [f'{name}_blob' for name in STREAM_FIELDS])
+            batch = []
+    if batch:
+        ActivityStream.objects.bulk_update(batch, [f'{name}_blob' for name in STREAM_FIELDS])
+
+
+def decompress_streams(apps, schema_editor):
+    ActivityStream = apps.get_model('training', 'ActivityStream')
+    streams = ActivityStream.objects.only('id', *[f'{name}_blob' for name in STREAM_FIELDS])
+    batch = []
+    for stream in streams.iterator(chunk_size=100):
+        for name in STREAM_FIELDS:
+            setattr(stream, name, getattr(stream, f'{name}_blob'))
+        batch.append(stream)
+        if len(batch) == 100:
+            ActivityStream.objects.bulk_update(batch, list(STREAM_FIELDS))
+            batch = []
+    if batch:
+        ActivityStream.objects.bulk_update(batch, list(STREAM_FIELDS))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('training', '0006_completedworkout_strava_start_date'),
+    ]
+
+    operations = [
+        *[
+            migrations.AddField(
+                model_name='activitystream',
+                name=f'{name}_blob',
+                field=vught_pace_keeper.core.fields.CompressedArrayField(default=list, help_text=help_text, typecode=typecode),
+            )
+            for name, (typecode, help_text) in STREAM_FIELDS.items()
+        ],
+        migrations.RunPython(compress_streams, decompress_streams),
+        *[
+            migrations.RemoveField(
+                model_name='activitystream',
+                name=name,
+            )
+            for name in STREAM_FIELDS
+        ],
+        *[
+            migrations.RenameField(
+                model_name='activitystream',
+                old_name=f'{name}_blob',
+                new_name=name,
+            )
+            for name in STREAM_FIELDS
+        ],
+    ]
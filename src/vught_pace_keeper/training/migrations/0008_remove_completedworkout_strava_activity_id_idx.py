@@ -0,0 +1,17 @@
+# Generated by Django 5.2.9 on 2026-10-15 12:05
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('training', '0007_compress_activity_streams'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='completedworkout',
+            name='training_co_strava__905eda_idx',
+        ),
+    ]
@@ -3,6 +3,7 @@ from django.contrib.gis.db import models as gis_models
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
 
+from vught_pace_keeper.core.fields import CompressedArrayField
 from vught_pace_keeper.core.models import TimestampedModel
 
 
@@ -106,6 +107,7 @@ class TrainingPlan(TimestampedModel):
         indexes = [
             models.Index(fields=["user", "-created_at"]),
             models.Index(fields=["is_template"]),
+            models.Index(fields=["user", "target_race_date"]),
         ]
 
     def __str__(self):
@@ -299,6 +301,11 @@ class CompletedWorkout(TimestampedModel):
         unique=True,
         help_text="Strava activity ID for deduplication",
     )
+    strava_start_date = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="Activity start time reported by Strava",
+    )
     perceived_effort = models.PositiveSmallIntegerField(
         null=True,
         blank=True,
@@ -312,7 +319,6 @@ class CompletedWorkout(TimestampedModel):
         indexes = [
             models.Index(fields=["user", "-date"]),
             models.Index(fields=["user", "date"]),
-            models.Index(fields=["strava_activity_id"]),
         ]
 
     def __str__(self):
@@ -327,12 +333,16 @@ class ActivityStream(models.Model):
         on_delete=models.CASCADE,
         related_name="stream",
     )
-    # Store as JSON arrays - efficient for time-series data
-    time_data = models.JSONField(default=list, help_text="Seconds from start")
-    distance_data = models.JSONField(default=list, help_text="Meters")
-    heartrate_data = models.JSONField(default=list, help_text="BPM (may contain nulls)")
-    velocity_data = models.JSONField(default=list, help_text="Meters per second")
-    altitude_data = models.JSONField(default=list, help_text="Meters elevation")
+    # Store as compressed binary arrays; each reads back as a list
+    time_data = CompressedArrayField(
+        typecode="i", default=list, help_text="Seconds from start"
+    )
+    distance_data = CompressedArrayField(default=list, help_text="Meters")
+    heartrate_data = CompressedArrayField(
+        typecode="i", default=list, help_text="BPM (may contain nulls)"
+    )
+    velocity_data = CompressedArrayField(default=list, help_text="Meters per second")
+    altitude_data = CompressedArrayField(default=list, help_text="Meters elevation")
 
     created_at = models.DateTimeField(auto_now_add=True)
 
@@ -5,6 +5,8 @@ from datetime import date, timedelta
 from decimal import Decimal
 from typing import TYPE_CHECKING, Optional
 
+from django.db.models import Prefetch
+
 from vught_pace_keeper.training.models import CompletedWorkout, ScheduledWorkout, TrainingPlan
 
 if TYPE_CHECKING:
@@ -81,11 +83,20 @@ class WorkoutMatchingService:
         """
         candidates = []
 
-        # Get all active plans for this user
+        # Get all active plans for this user, prefetching only scheduled
+        # workouts that are not rest days and not already matched
         plans = TrainingPlan.objects.filter(
             user=self.user,
             is_template=False,
-        ).prefetch_related("weeks__scheduled_workouts")
+        ).prefetch_related(
+            "weeks",
+            Prefetch(
+                "weeks__scheduled_workouts",
+                queryset=ScheduledWorkout.objects.filter(
+                    completions__isnull=True,
+                ).exclude(workout_type=ScheduledWorkout.WorkoutType.REST),
+            ),
+        )
 
         for plan in plans:
             if not plan.target_race_date or not plan.duration_weeks:
@@ -98,14 +109,6 @@ class WorkoutMatchingService:
                 week_start = plan_start + timedelta(weeks=week.week_number - 1)
 
                 for scheduled in week.scheduled_workouts.all():
-                    # Skip rest days
-                    if scheduled.workout_type == "rest":
-                        continue
-
-                    # Skip already matched workouts
-                    if scheduled.completions.exists():
-                        continue
-
                     # Calculate the scheduled workout date
                     scheduled_date = week_start + timedelta(days=scheduled.day_of_week - 1)
 
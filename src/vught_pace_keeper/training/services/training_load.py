@@ -1,5 +1,6 @@
 """Training load calculation service (TSS, ATL, CTL, TSB)."""
 
+import math
 from dataclasses import dataclass
 from datetime import date, timedelta
 from decimal import Decimal
@@ -24,6 +25,13 @@ CTL_DECAY = 42  # Chronic Training Load time constant (days)
 # Default threshold pace if user hasn't set one (5:00/km in decimal)
 DEFAULT_THRESHOLD_PACE = Decimal("5.00")
 
+# Decimal constants used on every workout/day; parsed once at import
+ZERO = Decimal("0")
+HUNDRED = Decimal("100")
+TWO_PLACES = Decimal("0.01")
+ATL_FACTOR = Decimal(str(1 - math.exp(-1 / ATL_DECAY)))
+CTL_FACTOR = Decimal(str(1 - math.exp(-1 / CTL_DECAY)))
+
 
 @dataclass
 class TrainingLoadSummary:
@@ -68,7 +76,7 @@ class TrainingLoadService:
         - IF < 1.0 means workout is easier than threshold
         """
         if not workout.actual_duration or not workout.average_pace_min_per_km:
-            return Decimal("0")
+            return ZERO
 
         threshold_pace = self.settings.threshold_pace or DEFAULT_THRESHOLD_PACE
         actual_pace = workout.average_pace_min_per_km
@@ -77,7 +85,7 @@ class TrainingLoadService:
         # Lower pace = faster, so IF = threshold/actual
         # If actual pace is faster (lower) than threshold, IF > 1
         if actual_pace <= 0:
-            return Decimal("0")
+            return ZERO
 
         intensity_factor = threshold_pace / actual_pace
 
@@ -85,9 +93,9 @@ class TrainingLoadService:
         duration_hours = Decimal(str(workout.actual_duration.total_seconds() / 3600))
 
         # TSS formula
-        tss = duration_hours * (intensity_factor ** 2) * Decimal("100")
+        tss = duration_hours * (intensity_factor ** 2) * HUNDRED
 
-        return tss.quantize(Decimal("0.01"))
+        return tss.quantize(TWO_PLACES)
 
     def calculate_daily_tss(self, day: date) -> Decimal:
         """Calculate total TSS for all workouts on a given day."""
@@ -96,11 +104,11 @@ class TrainingLoadService:
             date=day,
         )
 
-        total_tss = Decimal("0")
+        total_tss = ZERO
         for workout in workouts:
             total_tss += self.calculate_workout_tss(workout)
 
-        return total_tss.quantize(Decimal("0.01"))
+        return total_tss.quantize(TWO_PLACES)
 
     def update_training_load(self, day: date) -> TrainingLoad:
         """
@@ -111,8 +119,6 @@ class TrainingLoadService:
         - CTL (Chronic) = previous_CTL + (daily_TSS - previous_CTL) * (1 - e^(-1/42))
         - TSB = CTL - ATL
         """
-        import math
-
         # Calculate daily TSS
         daily_tss = self.calculate_daily_tss(day)
 
@@ -124,22 +130,18 @@ class TrainingLoadService:
             prev_ctl = previous_load.ctl
         except TrainingLoad.DoesNotExist:
             # Bootstrap with zeros or look back further
-            prev_atl = Decimal("0")
-            prev_ctl = Decimal("0")
-
-        # Exponential decay factors
-        atl_factor = Decimal(str(1 - math.exp(-1 / ATL_DECAY)))
-        ctl_factor = Decimal(str(1 - math.exp(-1 / CTL_DECAY)))
+            prev_atl = ZERO
+            prev_ctl = ZERO
 
         # Calculate new ATL and CTL
-        new_atl = prev_atl + (daily_tss - prev_atl) * atl_factor
-        new_ctl = prev_ctl + (daily_tss - prev_ctl) * ctl_factor
+        new_atl = prev_atl + (daily_tss - prev_atl) * ATL_FACTOR
+        new_ctl = prev_ctl + (daily_tss - prev_ctl) * CTL_FACTOR
         new_tsb = new_ctl - new_atl
 
         # Round to 2 decimal places
-        new_atl = new_atl.quantize(Decimal("0.01"))
-        new_ctl = new_ctl.quantize(Decimal("0.01"))
-        new_tsb = new_tsb.quantize(Decimal("0.01"))
+        new_atl = new_atl.quantize(TWO_PLACES)
+        new_ctl = new_ctl.quantize(TWO_PLACES)
+        new_tsb = new_tsb.quantize(TWO_PLACES)
 
         # Create or update the training load record
         load, _ = TrainingLoad.objects.update_or_create(
@@ -210,7 +212,7 @@ class TrainingLoadService:
             date__lte=today,
         ).aggregate(total=Sum("daily_tss"))
 
-        return result["total"] or Decimal("0")
+        return result["total"] or ZERO
 
     def get_summary(self) -> TrainingLoadSummary:
         """Get a complete summary of current training load status."""
@@ -224,10 +226,10 @@ class TrainingLoadService:
             form_status = current_load.form_status
             form_color = current_load.form_color
         else:
-            current_tss = Decimal("0")
-            atl = Decimal("0")
-            ctl = Decimal("0")
-            tsb = Decimal("0")
+            current_tss = ZERO
+            atl = ZERO
+            ctl = ZERO
+            tsb = ZERO
             form_status = "No Data"
             form_color = "#9ca3af"
 
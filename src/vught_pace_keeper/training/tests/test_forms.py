@@ -0,0 +1,102 @@
+"""Tests for training form helpers."""
+
+import codecs
+from decimal import Decimal
+
+import pytest
+
+from vught_pace_keeper.training.forms import (
+    GPXUploadForm,
+    WorkoutEditForm,
+    _minutes_seconds_from_pace,
+    _pace_from_minutes_seconds,
+    _pace_min_per_km,
+)
+
+
+@pytest.mark.parametrize(
+    "minutes, seconds, expected",
+    [
+        (5, 0, Decimal("5.00")),
+        (5, 30, Decimal("5.50")),
+        (4, 59, Decimal("4.98")),
+        (3, 1, Decimal("3.02")),
+    ],
+)
+def test_pace_from_minutes_seconds(minutes, seconds, expected):
+    assert _pace_from_minutes_seconds(minutes, seconds) == expected
+
+
+@pytest.mark.parametrize(
+    "pace, expected",
+    [
+        (Decimal("5.00"), (5, 0)),
+        (Decimal("5.50"), (5, 30)),
+        (Decimal("4.98"), (4, 59)),
+        (Decimal("5.99"), (5, 59)),
+    ],
+)
+def test_minutes_seconds_from_pace(pace, expected):
+    assert _minutes_seconds_from_pace(pace) == expected
+
+
+@pytest.mark.parametrize("seconds", range(60))
+def test_minutes_seconds_round_trip(seconds):
+    pace = _pace_from_minutes_seconds(5, seconds)
+    assert _minutes_seconds_from_pace(pace) == (5, seconds)
+
+
+@pytest.mark.parametrize(
+    "duration_seconds, distance_km, expected",
+    [
+        (1800, Decimal("5.00"), Decimal("6.00")),
+        (1650, Decimal("5.00"), Decimal("5.50")),
+        # 5.005 min/km: rounds half up, not to even
+        (3003, Decimal("10.00"), Decimal("5.01")),
+        # 5.0049... min/km rounds down
+        (3002, Decimal("10.00"), Decimal("5.00")),
+        (7597, Decimal("21.10"), Decimal("6.00")),
+    ],
+)
+def test_pace_min_per_km(duration_seconds, distance_km, expected):
+    assert _pace_min_per_km(duration_seconds, distance_km) == expected
+
+
+GPX_DOCUMENT = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<?xml-stylesheet type="text/xsl" href="gpx.xsl"?>\n'
+    f"<!-- {'exported by a very chatty tool ' * 40}-->\n"
+    '<gpx version="1.1" creator="test"></gpx>\n'
+)
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        GPX_DOCUMENT.encode(),
+        b"\n  " + GPX_DOCUMENT.encode(),
+        codecs.BOM_UTF8 + GPX_DOCUMENT.encode(),
+        codecs.BOM_UTF16_LE + GPX_DOCUMENT.encode("utf-16-le"),
+        codecs.BOM_UTF16_BE + GPX_DOCUMENT.encode("utf-16-be"),
+    ],
+)
+def test_gpx_sniff_accepts_xml(content):
+    head = content[: GPXUploadForm.SNIFF_BYTES]
+    assert GPXUploadForm._looks_like_xml(head)
+
+
+@pytest.mark.parametrize("content", [b"", b"PK\x03\x04", b"time,lat,lon\n"])
+def test_gpx_sniff_rejects_non_xml(content):
+    assert not GPXUploadForm._looks_like_xml(content)
+
+
+def test_workout_edit_form_allows_omitted_workout_type():
+    form = WorkoutEditForm(data={"description": "Easy shakeout"})
+    assert form.is_valid(), form.errors
+    assert form.cleaned_data["workout_type"] == ""
+
+
+def test_workout_edit_form_rejects_unknown_workout_type():
+    form = WorkoutEditForm(data={"workout_type": "sprint_to_the_moon"})
+    assert not form.is_valid()
+    assert "workout_type" in form.errors
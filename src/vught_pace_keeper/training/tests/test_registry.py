@@ -0,0 +1,57 @@
+"""Tests for the plan generator registry."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from vught_pace_keeper.training.generators import PlanGeneratorRegistry
+
+
+def make_generator(name: str, **min_weeks) -> SimpleNamespace:
+    return SimpleNamespace(
+        methodology_name=name,
+        display_name=name.title(),
+        min_weeks=min_weeks,
+    )
+
+
+@pytest.fixture
+def empty_registry():
+    """An empty registry; the real generators are restored afterwards."""
+    saved = PlanGeneratorRegistry.get_all_generators()
+    PlanGeneratorRegistry.clear()
+    yield PlanGeneratorRegistry
+    PlanGeneratorRegistry.clear()
+    for generator in saved.values():
+        PlanGeneratorRegistry.register(generator)
+
+
+def test_get_choices_is_cached(empty_registry):
+    empty_registry.register(make_generator("alpha"))
+    assert empty_registry.get_choices() is empty_registry.get_choices()
+
+
+def test_register_resets_choices(empty_registry):
+    empty_registry.register(make_generator("alpha"))
+    assert empty_registry.get_choices() == (("alpha", "Alpha"),)
+
+    empty_registry.register(make_generator("beta"))
+    assert empty_registry.get_choices() == (("alpha", "Alpha"), ("beta", "Beta"))
+
+
+def test_clear_resets_choices_and_min_weeks(empty_registry):
+    empty_registry.register(make_generator("alpha", half_marathon=10))
+    assert empty_registry.get_choices()
+    assert empty_registry.min_weeks_for("alpha", "half_marathon") == 10
+
+    empty_registry.clear()
+    assert empty_registry.get_choices() == ()
+    assert empty_registry.min_weeks_for("alpha", "half_marathon") is None
+
+
+def test_min_weeks_for_defaults(empty_registry):
+    empty_registry.register(make_generator("alpha", half_marathon=10))
+    assert empty_registry.min_weeks_for("alpha", "full_marathon") == (
+        PlanGeneratorRegistry.DEFAULT_MIN_WEEKS
+    )
+    assert empty_registry.min_weeks_for("unknown", "half_marathon") is None
@@ -342,7 +342,9 @@ def workout_edit(request, pk):
     if workout.week.plan.user != request.user:
         return HttpResponse(status=403)
 
-    form = WorkoutEditForm(instance=workout)
+    form = WorkoutEditForm(
+        initial={name: getattr(workout, name) for name in WorkoutEditForm.FIELDS}
+    )
 
     return render(
         request,
@@ -364,10 +366,18 @@ def workout_update(request, pk):
     if workout.week.plan.user != request.user:
         return HttpResponse(status=403)
 
-    form = WorkoutEditForm(request.POST, instance=workout)
+    form = WorkoutEditForm(request.POST)
 
     if form.is_valid():
-        form.save()
+        # An omitted workout_type leaves the current one in place
+        fields = [
+            name
+            for name in WorkoutEditForm.FIELDS
+            if name != "workout_type" or form.cleaned_data[name]
+        ]
+        for name in fields:
+            setattr(workout, name, form.cleaned_data[name])
+        workout.save(update_fields=[*fields, "updated_at"])
         return render(
             request,
             "training/partials/workout_row.html",